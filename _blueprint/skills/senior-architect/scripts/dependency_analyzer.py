@@ -5,19 +5,133 @@ Automated tool for senior architect tasks
 """
 
 import os
+import re
 import sys
 import json
 import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Below this many files the process pool startup costs more than it saves
+PARALLEL_MIN_FILES = 32
+PARSE_CHUNK_SIZE = 64
+# Front-matter is read from the head of the file; bodies are only read if the
+# closing delimiter is not found within this many bytes
+HEAD_BYTES = 8192
+
+# Parsed results are cached per file, keyed on (mtime_ns, size); bump the
+# version whenever the shape of a graph entry changes
+CACHE_FILE = '.dep_cache.json'
+_CACHE_VERSION = 1
+
+# Artifact directories relative to the blueprint root (see ARTIFACT_WRITE_DIRS
+# in _blueprint_server/agent_tools.py); R_D_Archive lives under dev_docs/brain
+DEFAULT_ROOTS = ('dev_docs/brain', 'dev_docs/logic', 'execution/backlog')
+SKIP_DIRS = frozenset({'.git', 'node_modules', '.venv', '__pycache__'})
+
+# Only the keys that feed the graph are captured; other lines are skipped inside the regex engine
+_FM_KV = re.compile(
+    r'^(id|dependencies|parent_goal|parent_feat|parent_uc)[ \t]*:[ \t]*(.*?)[ \t\r]*$',
+    re.MULTILINE,
+)
+_DEPS_SPLIT = re.compile(r'[\s,\[\]]+')
+
+
+def _write_json(obj, path: Optional[str] = None):
+    """Write results as indented JSON to path, or stdout if None.
+    orjson encodes in one C call; the stdlib fallback streams to the handle
+    instead of building the whole document as a string first."""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        if path:
+            with open(path, 'wb') as f:
+                f.write(data)
+        else:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(data + b'\n')
+            sys.stdout.buffer.flush()
+    elif path:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, indent=2)
+    else:
+        json.dump(obj, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+
+
+def _front_matter(content: str, complete: bool) -> Optional[str]:
+    """Return the text between the opening and closing '---' lines, or None.
+    When `content` is a truncated head, a delimiter on its last line is not trusted."""
+    first_nl = content.find('\n')
+    if not content.startswith('---') or first_nl < 0 or content[3:first_nl].strip(' \t\r'):
+        return None
+    # Scanning stops at the closing delimiter; '---' rules in the body are never visited
+    pos = first_nl
+    while True:
+        pos = content.find('\n---', pos)
+        if pos < 0:
+            return None
+        eol = content.find('\n', pos + 4)
+        if not content[pos + 4:len(content) if eol < 0 else eol].strip(' \t\r'):
+            break
+        pos += 4
+    if not complete and eol < 0:
+        return None
+    return content[first_nl + 1:pos]
+
+
+def _parse_md(path: str) -> Optional[Tuple[str, Dict]]:
+    """Extract (id, graph entry) from a single file, or None if it has no id"""
+    with open(path, 'rb') as f:
+        # Files without front-matter cost a single 3-byte read
+        prefix = f.read(3)
+        if prefix != b'---':
+            return None
+        head = prefix + f.read(HEAD_BYTES - 3)
+        content = head.decode('utf-8', errors='replace')
+        fm = _front_matter(content, complete=len(head) < HEAD_BYTES)
+        if fm is None and len(head) == HEAD_BYTES:
+            content = (head + f.read()).decode('utf-8', errors='replace')
+            fm = _front_matter(content, complete=True)
+    if fm is None:
+        return None
+    metadata = dict(_FM_KV.findall(fm))
+
+    art_id = metadata.get('id')
+    if not art_id:
+        return None
+    # Tokenize [FT-001, FT-002] format
+    deps = [d for d in _DEPS_SPLIT.split(metadata.get('dependencies', '')) if d]
+
+    return art_id, {
+        'file': path,
+        'dependencies': deps,
+        'parent': metadata.get('parent_goal') or metadata.get('parent_feat') or metadata.get('parent_uc')
+    }
+
+
+def _parse_md_safe(path: str) -> Tuple[Optional[Tuple[str, Dict]], Optional[str]]:
+    """Run _parse_md, returning (result, error message) so worker failures stay per-file"""
+    try:
+        return _parse_md(path), None
+    except Exception as e:
+        return None, str(e)
 
 class DependencyAnalyzer:
     """Main class for dependency analyzer functionality"""
     
-    def __init__(self, target_path: str, verbose: bool = False):
+    def __init__(self, target_path: str, verbose: bool = False, roots: Optional[List[str]] = None):
         self.target_path = Path(target_path)
         self.verbose = verbose
+        self.roots = list(DEFAULT_ROOTS) if roots is None else roots
         self.results = {}
+        self._cache: Dict[str, Dict] = {}
     
     def run(self) -> Dict:
         """Execute the main functionality"""
@@ -54,47 +168,105 @@ class DependencyAnalyzer:
         self.results['graph'] = {}
         
         # Walk through _blueprint directory
-        for root, dirs, files in os.walk(self.target_path):
-            for file in files:
-                if file.endswith('.md'):
-                    path = Path(root) / file
-                    self.process_file(path)
+        self._cache = self._load_cache()
+        files = list(self._iter_md_files(*self._scan_roots()))
+        fresh: Dict[str, Dict] = {}
+        stale: List[str] = []
+        for path, st in files:
+            cached = self._cache.get(path)
+            if cached and cached['mtime_ns'] == st.st_mtime_ns and cached['size'] == st.st_size:
+                fresh[path] = cached
+            else:
+                stale.append(path)
+
+        if len(stale) < PARALLEL_MIN_FILES:
+            results = map(_parse_md_safe, stale)
+        else:
+            # Files are independent; parse them across processes and merge here
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                results = list(executor.map(_parse_md_safe, stale, chunksize=PARSE_CHUNK_SIZE))
+        errors: Dict[str, str] = {}
+        for path, (parsed, error) in zip(stale, results):
+            if error:
+                errors[path] = error
+            else:
+                fresh[path] = {'result': parsed}
+
+        # Merge in walk order so duplicate ids resolve the same way with or without the cache
+        for path, st in files:
+            if path in errors:
+                self._merge(path, None, errors[path])
+                continue
+            record = fresh[path]
+            record['mtime_ns'] = st.st_mtime_ns
+            record['size'] = st.st_size
+            parsed = record['result']
+            self._merge(path, tuple(parsed) if parsed else None, None)
+        self._save_cache(fresh)
         
         if self.verbose:
             print(f"✓ Analysis complete: {len(self.results['graph'])} artifacts indexed")
 
-    def process_file(self, path: Path):
-        """Extract ID and dependencies from a single file"""
+    def _scan_roots(self) -> List[str]:
+        """Configured roots that exist under the target, or the target itself if none do"""
+        roots = [os.path.normpath(os.path.join(self.target_path, r)) for r in self.roots]
+        present = [r for r in roots if os.path.isdir(r)]
+        if self.verbose:
+            for r in roots:
+                if r not in present:
+                    print(f"⚠️ Skipping missing root: {r}")
+        return present or [str(self.target_path)]
+
+    def _iter_md_files(self, *roots: str) -> Iterator[Tuple[str, os.stat_result]]:
+        """Yield (path, stat) of all .md files under roots using cached DirEntry metadata"""
+        pending = deque(reversed(roots))
+        while pending:
+            d = pending.pop()
+            try:
+                with os.scandir(d) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in SKIP_DIRS:
+                                pending.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False) and entry.name.endswith('.md'):
+                            yield entry.path, entry.stat(follow_symlinks=False)
+            except OSError as e:
+                if self.verbose:
+                    print(f"⚠️ Cannot scan {d}: {e}")
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        """Load the per-file parse cache, discarding it on any version mismatch"""
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                # Basic YAML extraction logic
-                if content.startswith('---'):
-                    parts = content.split('---')
-                    if len(parts) >= 3:
-                        yaml_part = parts[1]
-                        lines = yaml_part.strip().split('\n')
-                        metadata = {}
-                        for line in lines:
-                            if ':' in line:
-                                k, v = line.split(':', 1)
-                                metadata[k.strip()] = v.strip()
-                        
-                        art_id = metadata.get('id')
-                        if art_id:
-                            deps = metadata.get('dependencies', '[]')
-                            # Clean up [FT-001, FT-002] format
-                            deps = deps.strip('[]').split(',')
-                            deps = [d.strip() for d in deps if d.strip()]
-                            
-                            self.results['graph'][art_id] = {
-                                'file': str(path),
-                                'dependencies': deps,
-                                'parent': metadata.get('parent_goal') or metadata.get('parent_feat') or metadata.get('parent_uc')
-                            }
-        except Exception as e:
+            with open(self.target_path / CACHE_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('version') != _CACHE_VERSION:
+            return {}
+        return data.get('files', {})
+
+    def _save_cache(self, files: Dict[str, Dict]):
+        """Persist the per-file parse cache; failures only cost the next run a re-parse"""
+        try:
+            with open(self.target_path / CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump({'version': _CACHE_VERSION, 'files': files}, f)
+        except OSError as e:
+            if self.verbose:
+                print(f"⚠️ Cannot write cache: {e}")
+
+    def process_file(self, path: str):
+        """Extract ID and dependencies from a single file"""
+        self._merge(path, *_parse_md_safe(path))
+
+    def _merge(self, path: str, parsed: Optional[Tuple[str, Dict]], error: Optional[str]):
+        """Fold one parse result into the dependency graph"""
+        if error:
             if self.verbose:
-                print(f"⚠️ Error processing {path}: {e}")
+                print(f"⚠️ Error processing {path}: {error}")
+            return
+        if parsed:
+            art_id, entry = parsed
+            self.results['graph'][art_id] = entry
     
     def generate_report(self):
         """Generate and display the report"""
@@ -120,6 +292,12 @@ def main():
         action='store_true',
         help='Enable verbose output'
     )
+    parser.add_argument(
+        '--roots',
+        nargs='+',
+        default=list(DEFAULT_ROOTS),
+        help='Subdirectories of target to scan (default: %(default)s); use . for the whole tree'
+    )
     parser.add_argument(
         '--json',
         action='store_true',
@@ -134,19 +312,16 @@ def main():
     
     tool = DependencyAnalyzer(
         args.target,
-        verbose=args.verbose
+        verbose=args.verbose,
+        roots=args.roots
     )
     
     results = tool.run()
     
     if args.json:
-        output = json.dumps(results, indent=2)
+        _write_json(results, args.output)
         if args.output:
-            with open(args.output, 'w') as f:
-                f.write(output)
             print(f"Results written to {args.output}")
-        else:
-            print(output)
 
 if __name__ == '__main__':
     main()
@@ -6,7 +6,10 @@ All writes are validated against the traceability rules before touching the file
 
 from __future__ import annotations
 
-import datetime
+import atexit
+import functools
+import os
+import time
 from pathlib import Path
 from typing import Any
 
@@ -14,32 +17,56 @@ from mcp.server import Server
 from mcp.types import Tool, TextContent, ImageContent
 
 from config import BLUEPRINT_ROOT
-from fs_reader import read_frontmatter, write_frontmatter, patch_frontmatter, read_body
-from artifact_index import build_index, ID_PREFIXES
+from fs_reader import read_frontmatter, write_frontmatter, patch_frontmatter_fast, read_body
+from artifact_index import build_index, invalidate, lookup_by_id, ID_PREFIXES
 from validate_traceability import validate_traceability, check_transition, REQUIRED_FIELDS
 from logger import tool_call, tool_ok, tool_error, gate_blocked, artifact_created, status_change, validate_result
 import asyncio
 import yaml
-import chromadb
-from chromadb.utils import embedding_functions
 
 _INDEX_CACHE: dict[str, dict] | None = None
+_INDEX_FINGERPRINT: int | None = None
 _INDEX_CACHE_LOCK = asyncio.Lock()
 
+
+def _index_fingerprint() -> int:
+    """Cheap change marker: newest mtime among the artifact directories.
+    Adding, removing or renaming an artifact file bumps its directory's mtime."""
+    return max(
+        (p.stat().st_mtime_ns for p in ARTIFACT_WRITE_DIRS.values() if p.exists()),
+        default=0,
+    )
+
+
 async def get_cached_index() -> dict[str, dict]:
-    """Thread-safe cached index build."""
-    global _INDEX_CACHE
-    if _INDEX_CACHE is None:
+    """Thread-safe cached index build, rebuilt when the artifact directories change."""
+    global _INDEX_CACHE, _INDEX_FINGERPRINT
+    fingerprint = _index_fingerprint()
+    if _INDEX_CACHE is None or fingerprint != _INDEX_FINGERPRINT:
         async with _INDEX_CACHE_LOCK:
-            if _INDEX_CACHE is None:  # double-checked locking
-                import time
+            if _INDEX_CACHE is None or fingerprint != _INDEX_FINGERPRINT:  # double-checked locking
                 start = time.time()
                 from artifact_index import get_index
                 _INDEX_CACHE = get_index(force_refresh=True)
+                _INDEX_FINGERPRINT = fingerprint
                 print(f"Index built in {time.time()-start:.1f}s ({len(_INDEX_CACHE)} artifacts)")
     return _INDEX_CACHE
 
 
+def _cache_upsert(aid: str, entry: dict[str, Any], before: int) -> None:
+    """Reflect our own write in the cached index so the next tool call skips a rebuild.
+    `before` is the fingerprint taken just ahead of the write; if it no longer matches
+    the cached one, someone else changed the directories too and the stale fingerprint
+    is kept so get_cached_index() rebuilds."""
+    global _INDEX_FINGERPRINT
+    invalidate(entry["path"])
+    if _INDEX_CACHE is None:
+        return
+    _INDEX_CACHE[aid] = entry
+    if before == _INDEX_FINGERPRINT:
+        _INDEX_FINGERPRINT = _index_fingerprint()
+
+
 # ---------------------------------------------------------------------------
 # Directory routing per artifact type
 # ---------------------------------------------------------------------------
@@ -55,6 +82,27 @@ ARTIFACT_WRITE_DIRS: dict[str, Path] = {
 VALID_STATUSES = {"DRAFT", "REVIEW", "APPROVED", "NEEDS_FIX", "BLOCKED", "DONE", "ARCHIVED", "REJECTED"}
 VALID_TYPES = set(ARTIFACT_WRITE_DIRS.keys())
 
+# Sorted forms used by error messages and tool input schemas, built once at import
+_STATUS_ENUM = sorted(VALID_STATUSES)
+_TYPE_ENUM   = sorted(VALID_TYPES)
+_VALID_STATUSES_SORTED = ", ".join(_STATUS_ENUM)
+_VALID_TYPES_SORTED    = ", ".join(_TYPE_ENUM)
+
+_STATUS_LOG_TMPL = "---\nartifact: %s\nold_status: %s\nnew_status: %s\ntimestamp: %sZ\n---\n\n%s\n"
+_CRITIC_LOG_TMPL = (
+    "---\nartifact: %s\ntype: self_critique\nstatus: PENDING\n---\n\n"
+    "<!-- Agent: append your critique below -->\n"
+)
+
+_PARENT_FIELD = {"Goal": "parent_goal", "Feature": "parent_feat", "UseCase": "parent_uc"}
+
+_REQUIRED_BY_TYPE: dict[str, frozenset[str]] = {t: frozenset(fs) for t, fs in REQUIRED_FIELDS.items()}
+
+
+def _iso_utc(gm: time.struct_time | None = None) -> str:
+    """UTC timestamp in the front-matter format, e.g. 2024-01-31T12:00:00Z."""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", gm or time.gmtime())
+
 
 def _text(msg: str) -> list[TextContent]:
     return [TextContent(type="text", text=msg)]
@@ -78,13 +126,21 @@ async def _create_artifact(args: dict) -> list[TextContent]:
     tool_call("create_artifact", {"type": atype, "id": aid, "parent_id": parent_id or ""})
 
     if atype not in VALID_TYPES:
-        msg = f"Unknown artifact type '{atype}'. Valid: {', '.join(sorted(VALID_TYPES))}"
+        msg = f"Unknown artifact type '{atype}'. Valid: {_VALID_TYPES_SORTED}"
         tool_error("create_artifact", msg)
         return _err_text(msg)
 
-    idx = await get_cached_index()
+    # Cheapest check first: the target path is fixed by type and id
+    target_dir  = ARTIFACT_WRITE_DIRS[atype]
+    target_file = target_dir / f"{aid}.md"
+    if target_file.exists():
+        msg = f"Artifact '{aid}' already exists. Use update_status to modify."
+        tool_error("create_artifact", msg)
+        return _err_text(msg)
 
-    if parent_id and parent_id not in idx:
+    # Parents are read individually; Goals and orphan Research touch no other file
+    parent_entry = lookup_by_id(parent_id) if parent_id else None
+    if parent_id and not parent_entry:
         msg = f"Parent '{parent_id}' not found. Create the parent first."
         tool_error("create_artifact", msg)
         return _err_text(msg)
@@ -92,7 +148,7 @@ async def _create_artifact(args: dict) -> list[TextContent]:
     # Gate G1: Task needs APPROVED parent UC
     if atype == "Task":
         uc_id = str(metadata.get("parent_uc", parent_id or ""))
-        parent = idx.get(uc_id)
+        parent = parent_entry if uc_id == parent_id else lookup_by_id(uc_id)
         if not parent:
             msg = f"Task requires a valid parent_uc. '{uc_id}' not found."
             gate_blocked("G1", msg)
@@ -109,35 +165,31 @@ async def _create_artifact(args: dict) -> list[TextContent]:
     full_meta: dict[str, Any] = {
         "id":             aid,
         "status":         "DRAFT",
-        "created_at":     datetime.datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "created_at":     _iso_utc(),
         "revision_count": 1,
     }
     if parent_id:
-        parent_type = idx.get(parent_id, {}).get("type", "")
-        field_map = {"Goal": "parent_goal", "Feature": "parent_feat", "UseCase": "parent_uc"}
-        pfield = field_map.get(parent_type, "origin")
+        pfield = _PARENT_FIELD.get(parent_entry["type"], "origin")
         full_meta[pfield] = parent_id
     full_meta.update(metadata)
 
-    missing = [f for f in REQUIRED_FIELDS.get(atype, []) if not full_meta.get(f)]
-    if missing:
+    missing_set = _REQUIRED_BY_TYPE.get(atype, frozenset()) - {k for k, v in full_meta.items() if v}
+    if missing_set:
+        missing = [f for f in REQUIRED_FIELDS[atype] if f in missing_set]  # keep declared order
         msg = f"Missing required fields for {atype}: {', '.join(missing)}"
         tool_error("create_artifact", msg)
         return _err_text(msg)
 
-    target_dir  = ARTIFACT_WRITE_DIRS[atype]
-    target_file = target_dir / f"{aid}.md"
-    if target_file.exists():
-        msg = f"Artifact '{aid}' already exists. Use update_status to modify."
-        tool_error("create_artifact", msg)
-        return _err_text(msg)
-
+    before = _index_fingerprint()
     write_frontmatter(target_file, full_meta, content)
     artifact_created(aid, atype, str(target_file))
     tool_ok("create_artifact", f"{aid} ({atype}) → {target_file.name}")
-    # Invalidate cache since we wrote a new file
-    global _INDEX_CACHE
-    _INDEX_CACHE = None
+    _cache_upsert(aid, {
+        "type":         atype,
+        "path":         target_file,
+        "meta":         full_meta,
+        "body_snippet": content.strip()[:200],
+    }, before)
     return _text(f"✅ Artifact '{aid}' ({atype}) created at {target_file}")
 
 
@@ -149,12 +201,11 @@ async def _update_status(args: dict) -> list[TextContent]:
     tool_call("update_status", {"id": aid, "new_status": new_status})
 
     if new_status not in VALID_STATUSES:
-        msg = f"Invalid status '{new_status}'. Valid: {', '.join(sorted(VALID_STATUSES))}"
+        msg = f"Invalid status '{new_status}'. Valid: {_VALID_STATUSES_SORTED}"
         tool_error("update_status", msg)
         return _err_text(msg)
 
-    idx   = await get_cached_index()
-    entry = idx.get(aid)
+    entry = lookup_by_id(aid)
     if not entry:
         msg = f"Artifact '{aid}' not found."
         tool_error("update_status", msg)
@@ -168,83 +219,90 @@ async def _update_status(args: dict) -> list[TextContent]:
         tool_error("update_status", trans_error)
         return _err_text(f"❌ Forbidden transition: {trans_error}")
 
-    patch_frontmatter(entry["path"], {
+    gm = time.gmtime()
+    updates = {
         "status":         new_status,
-        "last_updated":   datetime.datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "last_updated":   _iso_utc(gm),
         "revision_count": entry["meta"].get("revision_count", 1) + 1,
-    })
+    }
+    before = _index_fingerprint()
+    patch_frontmatter_fast(entry["path"], updates)
+    entry["meta"].update(updates)
 
     log_dir = BLUEPRINT_ROOT / "dev_docs" / "quality" / "Review_Logs"
     log_dir.mkdir(parents=True, exist_ok=True)
-    ts       = datetime.datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+    ts       = time.strftime("%Y%m%dT%H%M%S", gm)
     log_path = log_dir / f"STATUS-{aid}-{ts}.md"
-    log_path.write_text(
-        f"---\nartifact: {aid}\nold_status: {old_status}\nnew_status: {new_status}\ntimestamp: {ts}Z\n---\n\n{note}\n",
-        encoding="utf-8",
-    )
+    log_path.write_bytes((_STATUS_LOG_TMPL % (aid, old_status, new_status, ts, note)).encode("utf-8"))
     status_change(aid, old_status, new_status)
     tool_ok("update_status", f"{aid}: {old_status} → {new_status}")
-    # Invalidate cache since we modified a file
-    global _INDEX_CACHE
-    _INDEX_CACHE = None
+    _cache_upsert(aid, entry, before)
 
     return [TextContent(type="text", text=f"Status of {aid} changed from {old_status} to {new_status}")]
 
 
 async def _validate_all(_args: dict) -> list[TextContent]:
     tool_call("validate_all", {})
-    # We must refresh the cache unconditionally because validate_traceability
-    # reads from the file system and generates a fresh report
+    # We must refresh the cache unconditionally: in-place edits made outside the
+    # server don't change the directory fingerprint. The fresh index is then
+    # shared with the validator instead of it scanning the tree a second time
     global _INDEX_CACHE
     _INDEX_CACHE = None
     idx = await get_cached_index()
 
-    report = validate_traceability()
+    report = validate_traceability(idx)
     validate_result(len(report.errors))
     return _text(report.summary())
 
 
+@functools.lru_cache(maxsize=1)
+def _read_protocol_text(path: Path, mtime_ns: int) -> str:
+    """Protocols rarely change within a session; mtime_ns in the key forces a re-read on edit."""
+    return path.read_text(encoding="utf-8")
+
+
+_CRITIC_PROTOCOL_PATH = BLUEPRINT_ROOT / "protocols" / "review" / "R1_Agent_Self_Critic.md"
+_DEFAULT_CRITIC_PROTOCOL = (
+    "# R1 Self-Critic Protocol (default)\n"
+    "Review the artifact below for:\n"
+    "1. Logical gaps or contradictions\n"
+    "2. Missing parent/child references\n"
+    "3. Ambiguous or untestable requirements\n"
+    "4. Hallucinated facts\n"
+    "Output a structured list of issues found."
+)
+
+
+def _load_critic_protocol() -> str:
+    try:
+        mtime_ns = _CRITIC_PROTOCOL_PATH.stat().st_mtime_ns
+    except OSError:
+        return _DEFAULT_CRITIC_PROTOCOL
+    return _read_protocol_text(_CRITIC_PROTOCOL_PATH, mtime_ns)
+
+
 async def _run_self_critique(args: dict) -> list[TextContent]:
     artifact_id = args.get("artifact_id", "")
     tool_call("run_self_critique", {"artifact_id": artifact_id})
 
-    idx   = await get_cached_index()
-    entry = idx.get(artifact_id)
+    entry = lookup_by_id(artifact_id)
     if not entry:
         msg = f"Artifact '{artifact_id}' not found."
         tool_error("run_self_critique", msg)
         return _err_text(msg)
 
-    critic_protocol = BLUEPRINT_ROOT / "protocols" / "review" / "R1_Agent_Self_Critic.md"
-    protocol_text = (
-        critic_protocol.read_text(encoding="utf-8")
-        if critic_protocol.exists()
-        else (
-            "# R1 Self-Critic Protocol (default)\n"
-            "Review the artifact below for:\n"
-            "1. Logical gaps or contradictions\n"
-            "2. Missing parent/child references\n"
-            "3. Ambiguous or untestable requirements\n"
-            "4. Hallucinated facts\n"
-            "Output a structured list of issues found."
-        )
-    )
-
+    protocol_text = _load_critic_protocol()
     artifact_text = entry["path"].read_text(encoding="utf-8")
-    combined = (
-        f"{protocol_text}\n\n"
-        f"---\n\n## Artifact to critique: {artifact_id}\n\n"
-        f"{artifact_text}"
-    )
+    combined = "".join((
+        protocol_text,
+        "\n\n---\n\n## Artifact to critique: ", artifact_id, "\n\n",
+        artifact_text,
+    ))
 
     log_dir  = BLUEPRINT_ROOT / "dev_docs" / "quality" / "Review_Logs"
     log_dir.mkdir(parents=True, exist_ok=True)
     log_path = log_dir / f"CRITIC-{artifact_id}.md"
-    log_path.write_text(
-        f"---\nartifact: {artifact_id}\ntype: self_critique\nstatus: PENDING\n---\n\n"
-        "<!-- Agent: append your critique below -->\n",
-        encoding="utf-8",
-    )
+    log_path.write_bytes((_CRITIC_LOG_TMPL % artifact_id).encode("utf-8"))
     tool_ok("run_self_critique", f"critique prompt ready for {artifact_id}")
     return _text(combined)
 
@@ -259,7 +317,12 @@ async def _get_backlog(_args: dict) -> list[TextContent]:
     idx = await get_cached_index()
     
     lines = ["# Backlog (Tasks merely reflecting _blueprint status)", ""]
-    for task_file in backlog_dir.glob("*.md"):
+    try:
+        with os.scandir(backlog_dir) as it:
+            task_files = [Path(e.path) for e in it if e.name.endswith(".md") and e.is_file()]
+    except OSError:
+        task_files = []
+    for task_file in task_files:
             meta = read_frontmatter(task_file)
             if meta:
                 lines.append(
@@ -284,12 +347,17 @@ async def _start_sprint(args: dict) -> list[TextContent]:
             return _err_text(f"Task '{tid}' not found or is not a Task.")
         valid_tasks.append(entry)
         
+    now_iso = _iso_utc()
     for entry in valid_tasks:
-        patch_frontmatter(entry["path"], {
+        updates = {
             "status": "IN_PROGRESS",
-            "last_updated": datetime.datetime.utcnow().isoformat(timespec="seconds") + "Z"
-        })
+            "last_updated": now_iso
+        }
+        before = _index_fingerprint()
+        patch_frontmatter_fast(entry["path"], updates)
         status_change(entry["meta"].get("id"), entry["meta"].get("status"), "IN_PROGRESS")
+        entry["meta"].update(updates)
+        _cache_upsert(str(entry["meta"]["id"]), entry, before)
         
     sprint_file = BLUEPRINT_ROOT / "execution" / "sprint_current.md"
     sprint_file.parent.mkdir(parents=True, exist_ok=True)
@@ -316,6 +384,38 @@ async def _start_sprint(args: dict) -> list[TextContent]:
     return _text(f"✅ Sprint started successfully with tasks: {', '.join(task_ids)}")
 
 
+class _LogWriter:
+    """Keeps append-mode handles open across tool calls.
+    Each write is flushed so other readers see it, but the file is only opened once.
+    At most `max_open` handles are kept; the oldest (e.g. yesterday's log) is closed first."""
+
+    def __init__(self, max_open: int = 4) -> None:
+        self._handles: dict[Path, Any] = {}
+        self._max_open = max_open
+
+    def write(self, path: Path, text: str) -> None:
+        f = self._handles.get(path)
+        if f is None:
+            while len(self._handles) >= self._max_open:
+                self.close(next(iter(self._handles)))
+            f = self._handles[path] = path.open("a", encoding="utf-8", buffering=8192)
+        f.write(text)
+        f.flush()
+
+    def close(self, path: Path) -> None:
+        f = self._handles.pop(path, None)
+        if f is not None:
+            f.close()
+
+    def close_all(self) -> None:
+        for path in list(self._handles):
+            self.close(path)
+
+
+_log_writer = _LogWriter()
+atexit.register(_log_writer.close_all)
+
+
 async def _log_session(args: dict) -> list[TextContent]:
     task_id = args.get("task_id", "General")
     action = args.get("action", "")
@@ -325,14 +425,14 @@ async def _log_session(args: dict) -> list[TextContent]:
     log_dir = BLUEPRINT_ROOT / "execution" / "session_logs"
     log_dir.mkdir(parents=True, exist_ok=True)
     
-    today = datetime.datetime.utcnow().strftime("%Y-%m-%d")
-    ts = datetime.datetime.utcnow().strftime("%H:%M:%S")
+    gm = time.gmtime()
+    today = time.strftime("%Y-%m-%d", gm)
+    ts = time.strftime("%H:%M:%S", gm)
     log_file = log_dir / f"{today}.md"
     
     entry = f"\n### [{ts}Z] Task: {task_id}\n**Action:** {action}\n**Result:** {result}\n---\n"
     
-    with log_file.open("a", encoding="utf-8") as f:
-        f.write(entry)
+    _log_writer.write(log_file, entry)
         
     tool_ok("log_session", f"Logged session action for {task_id}")
     return _text(f"✅ Session log appended to {log_file.name}")
@@ -408,27 +508,45 @@ async def _enrich_knowledge_from_web(args: dict) -> list[TextContent]:
     return _text(f"✅ Workflow initialized for topic: {topic}\n\nPlease follow these instructions to enrich the project knowledge base:\n{plan}")
 
 
+def _check_sprint_item(sprint_file: Path, task_id: str) -> bool:
+    """Tick `- [ ] task_id` in the sprint file by overwriting the single space byte.
+    Returns False (and writes nothing) if the task is not listed unchecked."""
+    marker = f"- [ ] {task_id}".encode("utf-8")
+    with sprint_file.open("r+b") as f:
+        data = f.read()
+        pos = data.find(marker)
+        # Only a whole-line match counts, so TSK-1 does not tick TSK-10
+        while pos != -1 and data[pos + len(marker):pos + len(marker) + 1] not in (b"", b"\n", b"\r"):
+            pos = data.find(marker, pos + 1)
+        if pos == -1:
+            return False
+        f.seek(pos + 3)
+        f.write(b"x")
+    return True
+
+
 async def _complete_task(args: dict) -> list[TextContent]:
     task_id = args.get("task_id", "")
     tool_call("complete_task", {"task_id": task_id})
     
-    idx = await get_cached_index()
-    entry = idx.get(task_id)
+    entry = lookup_by_id(task_id)
     if not entry or entry["type"] != "Task":
         return _err_text(f"Task '{task_id}' not found.")
         
     old_status = entry["meta"].get("status", "UNKNOWN")
-    patch_frontmatter(entry["path"], {
+    updates = {
         "status": "DONE",
-        "last_updated": datetime.datetime.utcnow().isoformat(timespec="seconds") + "Z"
-    })
+        "last_updated": _iso_utc()
+    }
+    before = _index_fingerprint()
+    patch_frontmatter_fast(entry["path"], updates)
+    entry["meta"].update(updates)
+    _cache_upsert(task_id, entry, before)
     status_change(task_id, old_status, "DONE")
     
     sprint_file = BLUEPRINT_ROOT / "execution" / "sprint_current.md"
     if sprint_file.exists():
-        content = sprint_file.read_text(encoding="utf-8")
-        content = content.replace(f"- [ ] {task_id}", f"- [x] {task_id}")
-        sprint_file.write_text(content, encoding="utf-8")
+        _check_sprint_item(sprint_file, task_id)
         
     tool_ok("complete_task", f"Completed {task_id}")
     return _text(f"✅ Task {task_id} marked as DONE.")
@@ -657,29 +775,46 @@ async def _find_usages(args: dict) -> list[TextContent]:
 # ---------------------------------------------------------------------------
 # RAG AND SKILLS INTEGRATION
 # ---------------------------------------------------------------------------
+# chromadb and its embedding model are imported on first RAG use, not at server start
+_CHROMA_CLIENT = None
+_EMBEDDING_FN = None
+_VECTOR_COLLECTION = None
+
+
+def _get_chroma_client():
+    global _CHROMA_CLIENT
+    if _CHROMA_CLIENT is None:
+        import chromadb
+        _CHROMA_CLIENT = chromadb.PersistentClient(path=str(BLUEPRINT_ROOT / ".vectordb"))
+    return _CHROMA_CLIENT
+
+
 def _get_vector_collection():
-    db_path = BLUEPRINT_ROOT / ".vectordb"
-    db_path = BLUEPRINT_ROOT / ".vectordb"
-    client = chromadb.PersistentClient(path=str(db_path))
-    # Using the default lightweight sentence-transformers model automatically handles local embeddings
-    ef = embedding_functions.DefaultEmbeddingFunction()
-    collection = client.get_or_create_collection(name="blueprint_knowledge", embedding_function=ef)
-    return collection
+    global _EMBEDDING_FN, _VECTOR_COLLECTION
+    if _VECTOR_COLLECTION is None:
+        if _EMBEDDING_FN is None:
+            from chromadb.utils import embedding_functions
+            # Using the default lightweight sentence-transformers model automatically handles local embeddings
+            _EMBEDDING_FN = embedding_functions.DefaultEmbeddingFunction()
+        _VECTOR_COLLECTION = _get_chroma_client().get_or_create_collection(
+            name="blueprint_knowledge", embedding_function=_EMBEDDING_FN,
+        )
+    return _VECTOR_COLLECTION
 
 async def _index_knowledge(args: dict) -> list[TextContent]:
     tool_call("index_knowledge", {})
     server = args.get("__server__")
 
+    global _VECTOR_COLLECTION
     try:
-        db_path = BLUEPRINT_ROOT / ".vectordb"
-        db_path = BLUEPRINT_ROOT / ".vectordb"
-        client = chromadb.PersistentClient(path=str(db_path))
+        client = _get_chroma_client()
         
         # New: Clean slate strategy to prevent bloat/duplicates
         try:
             client.delete_collection(name="blueprint_knowledge")
         except Exception:
             pass # First run or already deleted
+        _VECTOR_COLLECTION = None
             
         collection = _get_vector_collection()
     except Exception as e:
@@ -980,6 +1115,8 @@ _TOOL_HANDLERS = {
     "analyze_dependencies": _analyze_dependencies,
     "enrich_knowledge_from_web": _enrich_knowledge_from_web,
 }
+_AVAILABLE_TOOLS = ", ".join(_TOOL_HANDLERS)
+
 
 _TOOL_SCHEMAS: list[Tool] = [
     Tool(
@@ -991,7 +1128,7 @@ _TOOL_SCHEMAS: list[Tool] = [
         inputSchema={
             "type": "object",
             "properties": {
-                "type":      {"type": "string", "enum": sorted(VALID_TYPES)},
+                "type":      {"type": "string", "enum": _TYPE_ENUM},
                 "id":        {"type": "string", "description": "Unique ID, e.g. GL-001"},
                 "parent_id": {"type": "string", "description": "ID of the parent artifact"},
                 "content":   {"type": "string", "description": "Markdown body content"},
@@ -1007,7 +1144,7 @@ _TOOL_SCHEMAS: list[Tool] = [
             "type": "object",
             "properties": {
                 "id":         {"type": "string"},
-                "new_status": {"type": "string", "enum": sorted(VALID_STATUSES)},
+                "new_status": {"type": "string", "enum": _STATUS_ENUM},
                 "note":       {"type": "string", "description": "Optional note about why status changed"},
             },
             "required": ["id", "new_status"],
@@ -1223,7 +1360,7 @@ _TOOL_SCHEMAS: list[Tool] = [
             "properties": {
                 "type": {
                     "type": "string",
-                    "enum": ["Goal", "Feature", "Research", "UseCase", "Task"],
+                    "enum": _TYPE_ENUM,
                     "description": "The artifact type to get the next ID for."
                 },
             },
@@ -1258,13 +1395,15 @@ def register_agent_tools(server: Server) -> None:
 
     @server.list_tools()
     async def list_tools() -> list[Tool]:
+        # Built once at import and handed out as-is: a list passes the SDK's
+        # ListToolsResult validation without being copied
         return _TOOL_SCHEMAS
 
     @server.call_tool()
     async def call_tool(name: str, arguments: dict | None = None) -> list[TextContent]:
         handler = _TOOL_HANDLERS.get(name)
         if not handler:
-            return _err_text(f"Unknown tool '{name}'. Available: {', '.join(_TOOL_HANDLERS)}")
+            return _err_text(f"Unknown tool '{name}'. Available: {_AVAILABLE_TOOLS}")
         args = arguments or {}
         args["__server__"] = server
         return await handler(args)
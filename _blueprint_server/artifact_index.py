@@ -5,11 +5,21 @@ Handles: Goals (GL), Features (FT), Research (RS), Use Cases (UC), Tasks (TSK).
 
 from __future__ import annotations
 
+import datetime
+import json
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from config import BLUEPRINT_ROOT
-from fs_reader import read_frontmatter, read_body
+from fs_reader import read_artifact_head
 
 
 # ---------------------------------------------------------------------------
@@ -34,10 +44,8 @@ ID_PREFIXES: dict[str, str] = {
 
 
 def _type_from_id(artifact_id: str) -> str | None:
-    for prefix, atype in ID_PREFIXES.items():
-        if artifact_id.startswith(prefix + "-"):
-            return atype
-    return None
+    prefix, sep, _ = artifact_id.partition("-")
+    return ID_PREFIXES.get(prefix) if sep else None
 
 
 # ---------------------------------------------------------------------------
@@ -46,6 +54,118 @@ def _type_from_id(artifact_id: str) -> str | None:
 
 _INDEX_CACHE: dict[str, dict[str, Any]] | None = None
 
+# Per-file parse results keyed on path, reused while (mtime_ns, size) is unchanged
+_FILE_CACHE: dict[str, tuple[int, int, tuple[str, dict[str, Any]] | None]] = {}
+
+# Re-parses are I/O bound; below this many a thread pool costs more than it saves
+_PARALLEL_MIN_FILES = 16
+# Shared across builds so a rebuild does not pay thread start-up again; past ~8
+# workers the GIL-held YAML parsing dominates and more threads stop helping
+_PARSE_WORKERS = 8
+_PARSE_POOL: ThreadPoolExecutor | None = None
+
+# _FILE_CACHE is persisted here so a restarted server only re-parses changed files.
+# Plain JSON, so loading it can never run code. Bump the version whenever the shape
+# of a cache entry changes.
+_SNAPSHOT_PATH = BLUEPRINT_ROOT / ".cache" / "artifact_index.json"
+_SNAPSHOT_VERSION = 2
+_snapshot_loaded = False
+# Front-matter dates are stored as single-key objects under these tags
+_DATETIME_TAG = "$datetime"
+_DATE_TAG = "$date"
+
+# Parent links of the most recently built index, filled in by build_index
+_PARENT_KEYS = ("parent_uc", "parent_feat", "parent_goal", "origin")
+_PARENT: dict[str, str] = {}
+_CHILDREN: dict[str, list[str]] = {}
+_LINKED: tuple[dict | None, int] = (None, -1)  # (index, len) the maps describe
+
+
+def _encode(value: Any) -> Any:
+    """JSON-safe form of a front-matter value; TypeError if it would not round-trip."""
+    if value is None or isinstance(value, (str, int)):
+        return value
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            raise TypeError("non-finite float")
+        return value
+    if isinstance(value, datetime.datetime):
+        return {_DATETIME_TAG: value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {_DATE_TAG: value.isoformat()}
+    if isinstance(value, list):
+        return [_encode(v) for v in value]
+    if isinstance(value, dict):
+        if not all(isinstance(k, str) for k in value) or (
+            len(value) == 1 and next(iter(value)) in (_DATETIME_TAG, _DATE_TAG)
+        ):
+            raise TypeError("mapping keys do not round-trip")
+        return {k: _encode(v) for k, v in value.items()}
+    raise TypeError(type(value).__name__)
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    if isinstance(value, dict):
+        if len(value) == 1:
+            (tag, text), = value.items()
+            if tag == _DATETIME_TAG:
+                return datetime.datetime.fromisoformat(text)
+            if tag == _DATE_TAG:
+                return datetime.date.fromisoformat(text)
+        return {k: _decode(v) for k, v in value.items()}
+    return value
+
+
+def _load_snapshot() -> None:
+    """Seed _FILE_CACHE from the on-disk snapshot; any problem just means a cold build."""
+    global _snapshot_loaded
+    _snapshot_loaded = True
+    try:
+        raw = _SNAPSHOT_PATH.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        if data.get("version") != _SNAPSHOT_VERSION or data.get("root") != str(BLUEPRINT_ROOT):
+            return
+        files: dict[str, tuple[int, int, tuple[str, dict[str, Any]] | None]] = {}
+        for md_path, (mtime_ns, size, rec) in data["files"].items():
+            parsed = None
+            if rec is not None:
+                parsed = (rec["id"], {
+                    "type":         rec["type"],
+                    "path":         Path(md_path),
+                    "meta":         _decode(rec["meta"]),
+                    "body_snippet": rec["body_snippet"],
+                })
+            files[md_path] = (mtime_ns, size, parsed)
+    except Exception:
+        return
+    _FILE_CACHE.update(files)
+
+
+def _save_snapshot() -> None:
+    """Write _FILE_CACHE to disk. Entries whose front-matter cannot round-trip through
+    JSON are left out and simply re-parsed after a restart."""
+    files: dict[str, list] = {}
+    for md_path, (mtime_ns, size, parsed) in _FILE_CACHE.items():
+        rec = None
+        if parsed is not None:
+            artifact_id, entry = parsed
+            try:
+                meta = _encode(entry["meta"])
+            except TypeError:
+                continue
+            rec = {"id": artifact_id, "type": entry["type"], "meta": meta, "body_snippet": entry["body_snippet"]}
+        files[md_path] = [mtime_ns, size, rec]
+    data = {"version": _SNAPSHOT_VERSION, "root": str(BLUEPRINT_ROOT), "files": files}
+    try:
+        _SNAPSHOT_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = _SNAPSHOT_PATH.with_name(_SNAPSHOT_PATH.name + ".tmp")
+        tmp_path.write_bytes(orjson.dumps(data) if orjson is not None else json.dumps(data).encode("utf-8"))
+        os.replace(tmp_path, _SNAPSHOT_PATH)
+    except OSError:
+        pass
+
 def get_index(force_refresh: bool = False) -> dict[str, dict[str, Any]]:
     """Return the cached index, building it if it doesn't exist or if forced."""
     global _INDEX_CACHE
@@ -64,31 +184,141 @@ def build_index() -> dict[str, dict[str, Any]]:
             "body_snippet": str (first 200 chars)
         }
     """
+    global _PARSE_POOL
+    if not _snapshot_loaded:
+        _load_snapshot()
+    files: list[str] = []
+    stale: list[tuple[str, os.stat_result]] = []
+    for md_path, st in _walk_md(str(BLUEPRINT_ROOT)):
+        files.append(md_path)
+        cached = _FILE_CACHE.get(md_path)
+        if not (cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size):
+            stale.append((md_path, st))
+
+    stale_paths = [Path(p) for p, _ in stale]
+    if len(stale) > _PARALLEL_MIN_FILES:
+        if _PARSE_POOL is None:
+            _PARSE_POOL = ThreadPoolExecutor(max_workers=_PARSE_WORKERS, thread_name_prefix="index-parse")
+        parsed_stale = list(_PARSE_POOL.map(_parse_artifact, stale_paths))
+    else:
+        parsed_stale = [_parse_artifact(p) for p in stale_paths]
+    for (md_path, st), parsed in zip(stale, parsed_stale):
+        _FILE_CACHE[md_path] = (st.st_mtime_ns, st.st_size, parsed)
+
+    # Assemble in walk order so duplicate ids resolve the same way on every build
     index: dict[str, dict[str, Any]] = {}
-    for md_path in BLUEPRINT_ROOT.rglob("*.md"):
-        meta = read_frontmatter(md_path)
-        artifact_id = meta.get("id")
-        if not artifact_id:
-            continue
-        atype = _type_from_id(str(artifact_id))
-        if not atype:
-            continue
-        body = read_body(md_path)
-        index[str(artifact_id)] = {
-            "type":         atype,
-            "path":         md_path,
-            "meta":         meta,
-            "body_snippet": body[:200],
-        }
+    for md_path in files:
+        parsed = _FILE_CACHE[md_path][2]
+        if parsed:
+            index[parsed[0]] = parsed[1]
+    gone = _FILE_CACHE.keys() - set(files)
+    for md_path in gone:
+        del _FILE_CACHE[md_path]
+    if stale or gone:
+        _save_snapshot()
+    _link(index)
     return index
 
 
+def _link(index: dict[str, dict[str, Any]]) -> None:
+    """Rebuild _PARENT (first parent key by priority) and _CHILDREN (every parent key) for index."""
+    global _LINKED
+    _PARENT.clear()
+    _CHILDREN.clear()
+    for artifact_id, entry in index.items():
+        meta = entry["meta"]
+        seen: set[str] = set()
+        for key in _PARENT_KEYS:
+            val = meta.get(key)
+            if not val:
+                continue
+            parent = str(val)
+            if not seen:
+                _PARENT[artifact_id] = parent
+            if parent not in seen:
+                seen.add(parent)
+                _CHILDREN.setdefault(parent, []).append(artifact_id)
+    _LINKED = (index, len(index))
+
+
+def _linked(idx: dict[str, dict[str, Any]]) -> None:
+    """Make sure the parent maps describe idx; an added or removed entry forces a relink."""
+    if _LINKED[0] is not idx or _LINKED[1] != len(idx):
+        _link(idx)
+
+
+def _walk_md(root: str) -> Iterator[tuple[str, os.stat_result]]:
+    """Yield (path, stat) for every .md file under root, depth-first via os.scandir."""
+    pending = [root]
+    while pending:
+        d = pending.pop()
+        try:
+            with os.scandir(d) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.name.endswith(".md") and entry.is_file():
+                            yield entry.path, entry.stat()
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+def _parse_artifact(md_path: Path) -> tuple[str, dict[str, Any]] | None:
+    """Read one markdown file into (id, index entry), or None if it is not an artifact."""
+    meta, body_snippet = read_artifact_head(md_path)
+    artifact_id = meta.get("id")
+    if not artifact_id:
+        return None
+    atype = _type_from_id(str(artifact_id))
+    if not atype:
+        return None
+    return str(artifact_id), {
+        "type":         atype,
+        "path":         md_path,
+        "meta":         meta,
+        "body_snippet": body_snippet,
+    }
+
+
+def invalidate(path: Path) -> None:
+    """Forget the cached parse of `path` so the next build re-reads it.
+    Call after writing a file, since an in-place rewrite may keep the same mtime and size."""
+    _FILE_CACHE.pop(str(path), None)
+
+
 def get_by_id(artifact_id: str, index: dict[str, Any] | None = None) -> dict[str, Any] | None:
     """Return a single artifact dict or None if not found."""
     idx = index if index is not None else get_index()
     return idx.get(str(artifact_id))
 
 
+def lookup_by_id(artifact_id: str) -> dict[str, Any] | None:
+    """Return one artifact read fresh from its canonical file, without scanning the tree.
+    Falls back to a (cache-backed) index build if the file is misfiled."""
+    artifact_id = str(artifact_id)
+    atype = _type_from_id(artifact_id)
+    if not atype:
+        return None
+    md_path = str(ARTIFACT_DIRS[atype] / f"{artifact_id}.md")
+    try:
+        st = os.stat(md_path)
+    except OSError:
+        parsed = None
+    else:
+        cached = _FILE_CACHE.get(md_path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            parsed = cached[2]
+        else:
+            parsed = _parse_artifact(Path(md_path))
+            _FILE_CACHE[md_path] = (st.st_mtime_ns, st.st_size, parsed)
+    if parsed and parsed[0] == artifact_id:
+        return parsed[1]
+    return build_index().get(artifact_id)
+
+
 def get_by_type(atype: str, index: dict[str, Any] | None = None) -> list[dict[str, Any]]:
     """Return all artifacts of a given type (e.g. 'Goal', 'Task')."""
     idx = index if index is not None else get_index()
@@ -98,14 +328,8 @@ def get_by_type(atype: str, index: dict[str, Any] | None = None) -> list[dict[st
 def get_children(parent_id: str, index: dict[str, Any] | None = None) -> list[dict[str, Any]]:
     """Return all artifacts whose parent_goal / parent_feat / parent_uc == parent_id."""
     idx = index if index is not None else get_index()
-    results = []
-    for v in idx.values():
-        meta = v["meta"]
-        for key in ("parent_goal", "parent_feat", "parent_uc", "origin"):
-            if str(meta.get(key, "")) == str(parent_id):
-                results.append(v)
-                break
-    return results
+    _linked(idx)
+    return [idx[c] for c in _CHILDREN.get(str(parent_id), ())]
 
 
 def get_trace_path(artifact_id: str, index: dict[str, Any] | None = None) -> list[dict[str, Any]]:
@@ -114,28 +338,28 @@ def get_trace_path(artifact_id: str, index: dict[str, Any] | None = None) -> lis
     chain: list[dict[str, Any]] = []
     current_id = str(artifact_id)
     visited: set[str] = set()
+    _linked(idx)
     while current_id and current_id not in visited:
         visited.add(current_id)
         node = idx.get(current_id)
         if not node:
             break
         chain.append(node)
-        meta = node["meta"]
-        parent = None
-        for key in ("parent_uc", "parent_feat", "parent_goal", "origin"):
-            val = meta.get(key)
-            if val:
-                parent = str(val)
-                break
-        current_id = parent  # type: ignore[assignment]
+        current_id = _PARENT.get(current_id)  # type: ignore[assignment]
     return chain  # [artifact, ..., Goal]
 
 
-def to_json(index: dict[str, Any] | None = None) -> list[dict[str, Any]]:
-    """Serialize the index to a JSON-safe list (paths converted to strings)."""
+def to_json(
+    index: dict[str, Any] | None = None,
+    where: Callable[[dict[str, Any]], bool] | None = None,
+) -> list[dict[str, Any]]:
+    """Serialize the index to a JSON-safe list (paths converted to strings).
+    If `where` is given, only entries for which it returns True are included."""
     idx = index if index is not None else get_index()
     result = []
     for artifact_id, entry in idx.items():
+        if where is not None and not where(entry):
+            continue
         result.append({
             "id":           artifact_id,
             "type":         entry["type"],
@@ -5,12 +5,26 @@ Used by both the MCP Server (agent) and the PySide2 GUI (user).
 
 from __future__ import annotations
 
+import mmap
+import os
 import re
+import warnings
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:  # libyaml bindings; same output, parsed in C
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+    warnings.warn(
+        "PyYAML was built without libyaml; front-matter parsing falls back to the "
+        "pure-Python loader. Install libyaml (e.g. libyaml-dev) and reinstall PyYAML.",
+        RuntimeWarning,
+        stacklevel=2,
+    )
+
 
 FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
 
@@ -21,43 +35,246 @@ from config import BLUEPRINT_ROOT
 # Low-level helpers
 # ---------------------------------------------------------------------------
 
-def read_frontmatter(path: Path) -> dict[str, Any]:
-    """Parse YAML front-matter block from a markdown file.
-    Returns an empty dict if no front-matter is found."""
+def _match_frontmatter(text: str) -> tuple[str, int] | None:
+    """Locate the front-matter block as (yaml text, body offset), or None.
+    Plain LF or CRLF '---' delimiters are found with str.find; anything else
+    (trailing spaces on a delimiter line, mixed line endings) falls back to FRONTMATTER_RE."""
+    if not text.startswith("---"):
+        return None
+    if text.startswith("---\n"):
+        end = text.find("\n---", 4)
+        if end != -1 and text.startswith("\n", end + 4):
+            return text[4:end], end + 5
+    elif text.startswith("---\r\n") and text[5:6] not in ("\r", "\n"):
+        end = text.find("\n---", 5)
+        if end != -1 and text[end - 1] == "\r" and text.startswith("\r\n", end + 4):
+            return text[5:end], end + 6  # yaml keeps the trailing \r, as the regex group does
+    match = FRONTMATTER_RE.match(text)
+    return (match.group(1), match.end()) if match else None
+
+
+def _load_yaml(block: str) -> dict[str, Any]:
+    try:
+        return yaml.load(block, Loader=_SafeLoader) or {}
+    except yaml.YAMLError:
+        return {}
+
+
+def _split_frontmatter(text: str) -> tuple[dict[str, Any], str]:
+    """Split markdown text into (front-matter dict, stripped body) with a single match."""
+    fm = _match_frontmatter(text)
+    if not fm:
+        return {}, text.strip()
+    return _load_yaml(fm[0]), text[fm[1]:].strip()
+
+
+def _read_text(path: Path) -> str:
     try:
-        text = path.read_text(encoding="utf-8")
+        return path.read_text(encoding="utf-8")
     except (OSError, UnicodeDecodeError):
+        return ""
+
+
+# str(path) -> (mtime_ns, size, front-matter); oldest entries are evicted first
+_FM_CACHE: dict[str, tuple[int, int, dict[str, Any]]] = {}
+_FM_CACHE_MAX = 4096
+
+# Files at least this large are mapped rather than read when only front-matter is needed
+_MMAP_MIN_SIZE = 64 * 1024
+_O_NOATIME = getattr(os, "O_NOATIME", 0)
+
+
+def _open_noatime(path: str) -> int:
+    """os.open for reading without updating atime where the platform and ownership allow it."""
+    if _O_NOATIME:
+        try:
+            return os.open(path, os.O_RDONLY | _O_NOATIME)
+        except PermissionError:  # O_NOATIME needs the caller to own the file
+            pass
+    return os.open(path, os.O_RDONLY)
+
+
+# First bytes of a line that may start a whitespace run (ASCII or multi-byte); a block
+# whose first line starts with one of these is left to the full read
+_BLANK_LEAD = frozenset(b" \t\r\n\x0b\x0c\x1c\x1d\x1e\x1f") | frozenset(range(0x80, 0x100))
+
+
+def _blank(line: bytes) -> bool:
+    """True if `line` is empty or all whitespace, as `\\s*` in FRONTMATTER_RE sees it."""
+    return not line or line.decode("utf-8", errors="replace").isspace()
+
+
+def _read_frontmatter_mapped(path: str) -> dict[str, Any] | None:
+    """Front-matter of a large file, decoding only the bytes before the closing delimiter.
+    Handles an opening '---' line followed directly by content, where the block ends at the
+    first later '---' line, exactly as FRONTMATTER_RE would end it. Returns None for any
+    other layout so the caller can fall back to a full read."""
+    try:
+        fd = _open_noatime(path)
+    except OSError:
         return {}
-    match = FRONTMATTER_RE.match(text)
-    if not match:
+    try:
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:3] != b"---":
+                return {}
+            start = mm.find(b"\n", 3) + 1
+            if not start or not _blank(mm[3:start - 1]) or (start < len(mm) and mm[start] in _BLANK_LEAD):
+                return None
+            pos = start
+            while (pos := mm.find(b"\n---", pos)) != -1:
+                eol = mm.find(b"\n", pos + 4)
+                if eol == -1:
+                    break
+                if _blank(mm[pos + 4:eol]):
+                    return _load_yaml(mm[start:pos].decode("utf-8"))
+                pos += 4
+            return {}
+    except (OSError, ValueError, UnicodeDecodeError):
         return {}
+    finally:
+        os.close(fd)
+
+
+def read_frontmatter(path: Path) -> dict[str, Any]:
+    """Parse YAML front-matter block from a markdown file.
+    Returns an empty dict if no front-matter is found. Only the head of the file
+    is read when it already holds the closing delimiter (large files are mapped and
+    decoded up to the delimiter), and an unchanged file (same mtime and size) is not
+    read at all. The caller gets its own dict."""
+    key = str(path)
     try:
-        return yaml.safe_load(match.group(1)) or {}
-    except yaml.YAMLError:
+        st = os.stat(key)
+    except OSError:
         return {}
+    cached = _FM_CACHE.get(key)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return dict(cached[2])
+    meta = _read_frontmatter_mapped(key) if st.st_size >= _MMAP_MIN_SIZE else None
+    if meta is None:
+        meta = read_artifact_head(path, snippet_len=0)[0]
+    _FM_CACHE.pop(key, None)
+    if len(_FM_CACHE) >= _FM_CACHE_MAX:
+        del _FM_CACHE[next(iter(_FM_CACHE))]
+    _FM_CACHE[key] = (st.st_mtime_ns, st.st_size, meta)
+    return dict(meta)
 
 
 def read_body(path: Path) -> str:
     """Return the markdown content after the YAML front-matter block."""
+    text = _read_text(path)
+    fm = _match_frontmatter(text)
+    return (text[fm[1]:] if fm else text).strip()
+
+
+def read_artifact(path: Path) -> tuple[dict[str, Any], str]:
+    """Return (front-matter, body) from one read of the file."""
+    return _split_frontmatter(_read_text(path))
+
+
+def read_artifact_head(path: Path, snippet_len: int = 200, head_bytes: int = 4096) -> tuple[dict[str, Any], str]:
+    """Return (front-matter, first `snippet_len` chars of the body).
+    Only the first `head_bytes` are read when they hold the whole front-matter and
+    enough body text; otherwise the rest of the file is read as well."""
     try:
-        text = path.read_text(encoding="utf-8")
+        with path.open("rb") as f:
+            data = f.read(head_bytes)
+            if len(data) == head_bytes:
+                text = _decode_head(data)
+                if text is not None:
+                    fm = _match_frontmatter(text)
+                    if fm or not text.startswith("---"):
+                        body = text[fm[1] if fm else 0:].strip()
+                        if len(body) >= snippet_len:
+                            return (_load_yaml(fm[0]) if fm else {}), body[:snippet_len]
+                data += f.read()
+        text = data.decode("utf-8")
     except (OSError, UnicodeDecodeError):
-        return ""
-    return FRONTMATTER_RE.sub("", text, count=1).strip()
+        return {}, ""
+    meta, body = _split_frontmatter(text)
+    return meta, body[:snippet_len]
+
+
+def _decode_head(data: bytes) -> str | None:
+    """Decode a truncated UTF-8 head, dropping a multi-byte character cut at the end."""
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError as e:
+        if e.start >= len(data) - 3:
+            return data[:e.start].decode("utf-8", errors="ignore")
+        return None
+
+
+class _FrontmatterDumper(_SafeDumper):
+    """Block-style mappings, with lists of scalars kept inline (`dependencies: [TSK-001]`)
+    the way the templates write them."""
+
+
+def _represent_list(dumper: _FrontmatterDumper, data: list) -> yaml.Node:
+    flow = all(v is None or isinstance(v, (str, int, float, bool)) for v in data)
+    return dumper.represent_sequence("tag:yaml.org,2002:seq", data, flow_style=flow)
+
+
+_FrontmatterDumper.add_representer(list, _represent_list)
 
 
 def write_frontmatter(path: Path, metadata: dict[str, Any], body: str = "") -> None:
     """Write (or overwrite) the YAML front-matter + body to a markdown file.
-    Creates parent directories if they do not exist."""
+    Creates parent directories if they do not exist. The file is written to a
+    sibling temp file and renamed over the target, so readers never see a partial write."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    yaml_block = yaml.dump(metadata, allow_unicode=True, sort_keys=False)
-    content = f"---\n{yaml_block}---\n\n{body}"
-    path.write_text(content, encoding="utf-8")
+    yaml_block = yaml.dump(metadata, Dumper=_FrontmatterDumper, allow_unicode=True, sort_keys=False, encoding="utf-8")
+    _replace_file(path, b"".join((b"---\n", yaml_block, b"---\n\n", body.encode("utf-8"))))
+
+
+def _replace_file(path: Path, data: bytes) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    # A same-size rewrite within one mtime tick would otherwise look unchanged
+    _FM_CACHE.pop(str(path), None)
 
 
 def patch_frontmatter(path: Path, updates: dict[str, Any]) -> None:
-    """Merge `updates` into the existing YAML front-matter of a file."""
-    meta = read_frontmatter(path)
-    body = read_body(path)
+    """Merge `updates` into the existing YAML front-matter of a file.
+    The file is read once; front-matter and body come from the same text."""
+    meta, body = read_artifact(path)
     meta.update(updates)
     write_frontmatter(path, meta, body)
+
+
+def patch_frontmatter_fast(path: Path, updates: dict[str, Any]) -> None:
+    """Like patch_frontmatter, but rewrites only the `key: value` lines being updated.
+    Each value is rendered by the same YAML dumper, so the result parses identically;
+    anything that does not fit on one top-level line goes through patch_frontmatter.
+    Other keys, comments and the file's LF or CRLF line endings are left as written."""
+    try:
+        with path.open("r", encoding="utf-8", newline="") as f:
+            text = f.read()
+    except (OSError, UnicodeDecodeError):
+        return patch_frontmatter(path, updates)
+    nl = "\r\n" if text.startswith("---\r\n") else "\n"
+    start = 3 + len(nl)
+    end = text.find(nl + "---", start) if text.startswith("---" + nl) else -1
+    if end == -1 or not text.startswith(nl, end + len(nl) + 3):
+        return patch_frontmatter(path, updates)
+
+    lines = text[start:end].split(nl)
+    for key, value in updates.items():
+        rendered = yaml.dump({key: value}, Dumper=_FrontmatterDumper, allow_unicode=True, sort_keys=False)
+        if rendered.count("\n") != 1 or not rendered.startswith(f"{key}: "):
+            return patch_frontmatter(path, updates)
+        # Quoted or spaced spellings of the key are left to the full dump, never duplicated
+        key_line = re.compile(rf"[\"']?{re.escape(key)}[\"']?\s*:")
+        hits = [i for i, line in enumerate(lines) if key_line.match(line)]
+        if len(hits) > 1 or (hits and not lines[hits[0]].startswith(f"{key}:")):
+            return patch_frontmatter(path, updates)
+        if not hits:
+            lines.append(rendered[:-1])
+            continue
+        i = hits[0]
+        # A value continued on the following lines (block scalar, list) needs the full dump
+        if i + 1 < len(lines) and lines[i + 1][:1] in ("", " ", "\t", "-"):
+            return patch_frontmatter(path, updates)
+        lines[i] = rendered[:-1]
+
+    _replace_file(path, ("---" + nl + nl.join(lines) + text[end:]).encode("utf-8"))
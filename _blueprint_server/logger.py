@@ -5,8 +5,9 @@ All server modules import `log` from here.
 
 from __future__ import annotations
 
+import os
 import sys
-from datetime import datetime, timezone
+import time
 
 from rich.console import Console
 from rich.theme import Theme
@@ -29,8 +30,19 @@ _theme = Theme({
 console = Console(stderr=True, theme=_theme)
 
 
+# BLUEPRINT_LOG_LEVEL=QUIET silences the per-call tool/resource lines below
+_QUIET = os.environ.get("BLUEPRINT_LOG_LEVEL", "").upper() == "QUIET"
+
+_ts_cache: tuple[int, str] = (-1, "")
+
+
 def _ts() -> str:
-    return datetime.now(timezone.utc).strftime("%H:%M:%S")
+    # Formatted at most once per second; bursts of log lines reuse the string
+    global _ts_cache
+    now = int(time.time())
+    if _ts_cache[0] != now:
+        _ts_cache = (now, time.strftime("%H:%M:%S", time.gmtime(now)))
+    return _ts_cache[1]
 
 
 # ---------------------------------------------------------------------------
@@ -46,29 +58,56 @@ def server_start(name: str, version: str) -> None:
     ))
 
 
+# Hot-path lines are assembled as Text spans rather than markup strings, so Rich
+# skips markup parsing and brackets in messages are printed literally
+
 def tool_call(name: str, args: dict) -> None:
-    args_str = "  ".join(f"[trace]{k}[/trace]=[info]{_short(v)}[/info]" for k, v in args.items())
-    console.print(f"[trace]{_ts()}[/trace] [tool]TOOL[/tool] [bold]{name}[/bold]  {args_str}")
+    parts: list = [(_ts(), "trace"), " ", ("TOOL", "tool"), " ", (name, "bold"), " "]
+    for k, v in args.items():
+        parts += [" ", (k, "trace"), "=", (_short(v), "info"), " "]
+    console.print(Text.assemble(*parts[:-1]))
 
 
 def tool_ok(name: str, msg: str) -> None:
-    console.print(f"[trace]{_ts()}[/trace] [ok]  ✓[/ok] [bold]{name}[/bold]  {msg}")
+    console.print(Text.assemble((_ts(), "trace"), " ", ("  ✓", "ok"), " ", (name, "bold"), "  ", msg))
 
 
 def tool_error(name: str, msg: str) -> None:
-    console.print(f"[trace]{_ts()}[/trace] [error]  ✗[/error] [bold]{name}[/bold]  {msg}")
+    console.print(Text.assemble((_ts(), "trace"), " ", ("  ✗", "error"), " ", (name, "bold"), "  ", msg))
 
 
 def gate_blocked(rule: str, detail: str) -> None:
-    console.print(f"[trace]{_ts()}[/trace] [gate]GATE[/gate] [{rule}] {detail}")
+    console.print(Text.assemble((_ts(), "trace"), " ", ("GATE", "gate"), f" [{rule}] {detail}"))
+
+
+_recent: tuple[int, set[str]] = (-1, set())
+
+
+def _first_this_second(key: str) -> bool:
+    """True the first time `key` is seen within the current wall-clock second."""
+    global _recent
+    now = int(time.time())
+    if _recent[0] != now:
+        _recent = (now, set())
+    seen = _recent[1]
+    if key in seen:
+        return False
+    seen.add(key)
+    return True
 
 
+# Clients poll resources and prompts; identical lines within a second are printed once
+
 def resource_read(uri: str) -> None:
-    console.print(f"[trace]{_ts()}[/trace] [resource]RES[/resource]  {uri}")
+    if _first_this_second(uri):
+        console.print(Text.assemble((_ts(), "trace"), " ", ("RES", "resource"), "  ", uri))
 
 
 def prompt_load(name: str, path: str) -> None:
-    console.print(f"[trace]{_ts()}[/trace] [prompt]PROMPT[/prompt] {name}  [trace]← {path}[/trace]")
+    if _first_this_second(name):
+        console.print(Text.assemble(
+            (_ts(), "trace"), " ", ("PROMPT", "prompt"), f" {name}  ", (f"← {path}", "trace"),
+        ))
 
 
 def validate_result(error_count: int) -> None:
@@ -80,10 +119,10 @@ def validate_result(error_count: int) -> None:
 
 def status_change(artifact_id: str, old: str, new: str) -> None:
     color = "ok" if new == "APPROVED" else ("error" if new in ("NEEDS_FIX", "REJECTED") else "warn")
-    console.print(
-        f"[trace]{_ts()}[/trace] [bold]STATUS[/bold]  {artifact_id}  "
-        f"[trace]{old}[/trace] → [{color}]{new}[/{color}]"
-    )
+    console.print(Text.assemble(
+        (_ts(), "trace"), " ", ("STATUS", "bold"), f"  {artifact_id}  ",
+        (str(old), "trace"), " → ", (str(new), color),
+    ))
 
 
 def artifact_created(artifact_id: str, atype: str, path: str) -> None:
@@ -96,3 +135,11 @@ def artifact_created(artifact_id: str, atype: str, path: str) -> None:
 def _short(v: object, max_len: int = 60) -> str:
     s = str(v)
     return s if len(s) <= max_len else s[:max_len] + "…"
+
+
+def _noop(*_args, **_kwargs) -> None:
+    return None
+
+
+if _QUIET:
+    tool_call = tool_ok = tool_error = gate_blocked = resource_read = prompt_load = status_change = _noop
@@ -5,6 +5,10 @@ Reads protocol .md files from _blueprint/protocols/ and registers them as named
 
 from __future__ import annotations
 
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
+
 from mcp.server import Server
 from mcp.types import Prompt, PromptMessage, TextContent
 
@@ -13,32 +17,36 @@ from logger import prompt_load
 
 PROTOCOLS_DIR = BLUEPRINT_ROOT / "protocols"
 
-# Name → relative path inside protocols/
-PROMPT_MAP: dict[str, str] = {
-    "p0_ingestion":        BLUEPRINT_ROOT / "protocols" / "generation" / "P0_Ingestion.md",
-    "p0_5_bug_triage":     BLUEPRINT_ROOT / "protocols" / "generation" / "P0_5_Bug_Triage.md",
-    "p1_inception":        BLUEPRINT_ROOT / "protocols" / "generation" / "P1_Inception.md",
-    "p1_5_goal_decomp":    BLUEPRINT_ROOT / "protocols" / "generation" / "P1_5_Goal_Decomposition.md",
-    "p2_research":         BLUEPRINT_ROOT / "protocols" / "generation" / "P2_Research.md",
-    "p2_5_ui_architecture": BLUEPRINT_ROOT / "protocols" / "generation" / "P2_5_UI_Architecture.md",
-    "p3_analysis":         BLUEPRINT_ROOT / "protocols" / "generation" / "P3_Analysis.md",
-    "p4_dev_sync":         BLUEPRINT_ROOT / "protocols" / "generation" / "P4_Dev_Sync.md",
-    "p5_sprint_planning":  BLUEPRINT_ROOT / "protocols" / "generation" / "P5_Sprint_Planning.md",
-    "e1_sprint_execution": BLUEPRINT_ROOT / "protocols" / "execution" / "E1_Sprint_Execution.md",
-    "meta_rules":          BLUEPRINT_ROOT / "protocols" / "meta" / "Metadata_Schema.md",
-    "self_critic":         BLUEPRINT_ROOT / "protocols" / "review" / "R1_Agent_Self_Critic.md",
-    "r2_user_critique":    BLUEPRINT_ROOT / "protocols" / "review" / "R2_User_Critique_Process.md",
-    "fix_protocol":        BLUEPRINT_ROOT / "protocols" / "review" / "R3_Fix_and_Refactor.md",
-    "s4_rejection_handler": BLUEPRINT_ROOT / "protocols" / "interactive" / "S4_Rejection_Handler.md",
-    "p8_knowledge_audit":  BLUEPRINT_ROOT / "protocols" / "knowledge" / "P8_Knowledge_Audit.md",
+# Name → path relative to protocols/
+_PROMPT_FILES: dict[str, str] = {
+    "p0_ingestion":         "generation/P0_Ingestion.md",
+    "p0_5_bug_triage":      "generation/P0_5_Bug_Triage.md",
+    "p1_inception":         "generation/P1_Inception.md",
+    "p1_5_goal_decomp":     "generation/P1_5_Goal_Decomposition.md",
+    "p2_research":          "generation/P2_Research.md",
+    "p2_5_ui_architecture": "generation/P2_5_UI_Architecture.md",
+    "p3_analysis":          "generation/P3_Analysis.md",
+    "p4_dev_sync":          "generation/P4_Dev_Sync.md",
+    "p5_sprint_planning":   "generation/P5_Sprint_Planning.md",
+    "e1_sprint_execution":  "execution/E1_Sprint_Execution.md",
+    "meta_rules":           "meta/Metadata_Schema.md",
+    "self_critic":          "review/R1_Agent_Self_Critic.md",
+    "r2_user_critique":     "review/R2_User_Critique_Process.md",
+    "fix_protocol":         "review/R3_Fix_and_Refactor.md",
+    "s4_rejection_handler": "interactive/S4_Rejection_Handler.md",
+    "p8_knowledge_audit":   "knowledge/P8_Knowledge_Audit.md",
     # Meta protocols
-    "meta_rules":          BLUEPRINT_ROOT / "protocols" / "meta" / "Metadata_Schema.md",
-    "file_naming":         BLUEPRINT_ROOT / "protocols" / "meta" / "File_Naming.md",
-    "validation_rules":    BLUEPRINT_ROOT / "protocols" / "meta" / "Validation_Rules.md",
-    "state_machine":       BLUEPRINT_ROOT / "protocols" / "meta" / "State_Machine.md",
-    "agent_quick_ref":     BLUEPRINT_ROOT / "protocols" / "meta" / "Agent_Quick_Reference.md",
+    "file_naming":          "meta/File_Naming.md",
+    "validation_rules":     "meta/Validation_Rules.md",
+    "state_machine":        "meta/State_Machine.md",
+    "agent_quick_ref":      "meta/Agent_Quick_Reference.md",
 }
 
+# Resolved once at import; read-only so handlers cannot drift from the table above
+PROMPT_MAP: Mapping[str, Path] = MappingProxyType(
+    {name: PROTOCOLS_DIR / rel_path for name, rel_path in _PROMPT_FILES.items()}
+)
+
 DESCRIPTIONS: dict[str, str] = {
     "p0_ingestion": "Convert raw inbound material into structured blueprint artifacts",
     "p0_5_bug_triage": "Triage a bug report into a structured artifact",
@@ -56,7 +64,6 @@ DESCRIPTIONS: dict[str, str] = {
     "s4_rejection_handler": "Decide whether to fix+resubmit or archive a NEEDS_FIX/REJECTED artifact",
     "p8_knowledge_audit": "Perform lifecycle management: verify, prune, and enrich RAG knowledge",
     # Meta
-    "meta_rules":   "Metadata schema and file naming rules for all artifacts",
     "file_naming":  "ID prefixes, directory rules, and file naming conventions",
     "validation_rules": "Gate rules G1-G7, soft warnings W1-W4, forbidden transitions",
     "state_machine": "Artifact lifecycle states and transition diagram",
@@ -64,36 +71,64 @@ DESCRIPTIONS: dict[str, str] = {
 }
 
 
-def _load_protocol(rel_path: str) -> str:
-    fpath = PROTOCOLS_DIR / rel_path
-    if fpath.exists():
-        return fpath.read_text(encoding="utf-8")
-    return f"# Protocol file not found\nExpected: {fpath}\nCreate this file to activate the protocol."
+# Prompt name → protocol text; protocol files are static for the server's lifetime
+_PROTOCOL_CACHE: dict[str, str] = {}
+
+
+def refresh_protocols() -> None:
+    """(Re)load every protocol file in PROMPT_MAP into _PROTOCOL_CACHE."""
+    _PROTOCOL_CACHE.clear()
+    for name, fpath in PROMPT_MAP.items():
+        try:
+            _PROTOCOL_CACHE[name] = fpath.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            pass
+
+
+def _load_protocol(name: str, fpath: Path) -> str:
+    cached = _PROTOCOL_CACHE.get(name)
+    if cached is not None:
+        return cached
+    # Missing at startup; the file may have been created since
+    try:
+        _PROTOCOL_CACHE[name] = content = fpath.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return f"# Protocol file not found\nExpected: {fpath}\nCreate this file to activate the protocol."
+    return content
+
+
+# PROMPT_MAP and DESCRIPTIONS are fixed after import, so the listing is too
+_PROMPTS: tuple[Prompt, ...] = tuple(
+    Prompt(
+        name=name,
+        description=DESCRIPTIONS.get(name, ""),
+        arguments=[],
+    )
+    for name in PROMPT_MAP
+)
+_AVAILABLE_PROMPTS = ", ".join(PROMPT_MAP)
 
 
 def register_prompts(server: Server) -> None:
-    """Register all blueprint protocol files as MCP Prompts."""
+    """Register all blueprint protocol files as MCP Prompts.
+    Safe to call for several Server instances; protocol files are read once per process."""
+    if not _PROTOCOL_CACHE:
+        refresh_protocols()
 
     @server.list_prompts()
     async def list_prompts() -> list[Prompt]:
-        return [
-            Prompt(
-                name=name,
-                description=DESCRIPTIONS.get(name, ""),
-                arguments=[],
-            )
-            for name in PROMPT_MAP
-        ]
+        return list(_PROMPTS)
 
     @server.get_prompt()
     async def get_prompt(name: str, arguments: dict | None = None) -> list[PromptMessage]:
         # `name` may come as a positional arg from SDK dispatcher
-        rel_path = PROMPT_MAP.get(str(name))
-        if not rel_path:
-            content = f"Unknown prompt: {name}. Available: {', '.join(PROMPT_MAP)}"
+        name = str(name)
+        fpath = PROMPT_MAP.get(name)
+        if not fpath:
+            content = f"Unknown prompt: {name}. Available: {_AVAILABLE_PROMPTS}"
         else:
-            prompt_load(str(name), rel_path)
-            content = _load_protocol(rel_path)
+            prompt_load(name, str(fpath))
+            content = _load_protocol(name, fpath)
         return [
             PromptMessage(
                 role="user",
@@ -6,7 +6,15 @@ Exposes live, read-only data about the _blueprint/ state to the LLM agent.
 from __future__ import annotations
 
 import json
+import os
+import time
 from pathlib import Path
+from typing import Callable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from mcp.server import Server
 from mcp.types import Resource, TextContent, ReadResourceResult, TextResourceContents
@@ -16,9 +24,107 @@ from artifact_index import build_index, to_json
 from fs_reader import read_frontmatter
 from logger import resource_read
 
+# Reads that land within this many seconds of a build share its index
+_INDEX_TTL = 1.0
+_INDEX_CACHE: tuple[float, dict] | None = None
+
+
+def _dumps(obj: object) -> str:
+    """Indented JSON text; orjson when installed, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+_BRAIN_DIR = BLUEPRINT_ROOT / "dev_docs" / "brain"
+_BRAIN_FILES = ("Design_Patterns.md", "Anti_Patterns.md", "Terminology.md")
+# (per-file stat signature, joined text) of the last knowledge/brain read
+_BRAIN_CACHE: tuple[tuple, str] | None = None
+
+
+def _brain_signature() -> tuple:
+    sig = []
+    for fname in _BRAIN_FILES:
+        try:
+            st = os.stat(_BRAIN_DIR / fname)
+            sig.append((st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
+            sig.append(None)
+    return tuple(sig)
+
+
+def _brain_text() -> str:
+    """Joined knowledge-base files, re-read only when one of them changes, appears or disappears."""
+    global _BRAIN_CACHE
+    sig = _brain_signature()
+    if _BRAIN_CACHE is not None and _BRAIN_CACHE[0] == sig:
+        return _BRAIN_CACHE[1]
+    sections: list[str] = []
+    for fname, file_sig in zip(_BRAIN_FILES, sig):
+        if file_sig is not None:
+            sections.append(f"## {fname}\n\n{(_BRAIN_DIR / fname).read_text(encoding='utf-8')}")
+    text = "\n\n---\n\n".join(sections) or "Knowledge base is empty."
+    _BRAIN_CACHE = (sig, text)
+    return text
+
+
+def _is_pending(entry: dict) -> bool:
+    return entry["meta"].get("status") in ("REVIEW", "NEEDS_FIX")
+
+
+def _cached_index() -> dict:
+    """build_index(), memoized for _INDEX_TTL seconds."""
+    global _INDEX_CACHE
+    now = time.monotonic()
+    if _INDEX_CACHE is None or now - _INDEX_CACHE[0] >= _INDEX_TTL:
+        _INDEX_CACHE = (now, build_index())
+    return _INDEX_CACHE[1]
+
+
+def _read_index() -> str:
+    data = to_json(_cached_index())
+    resource_read(f"blueprint://index  ({len(data)} artifacts)")
+    return _dumps(data)
+
+
+def _read_pending() -> str:
+    pending = to_json(_cached_index(), where=_is_pending)
+    feedback_dir = BLUEPRINT_ROOT / "inbound" / "User_Feedback"
+    feedbacks: list[dict] = []
+    try:
+        with os.scandir(feedback_dir) as it:
+            fb_entries = [
+                e for e in it
+                if e.name.startswith("FB-") and e.name.endswith(".md") and e.is_file()
+            ]
+    except FileNotFoundError:
+        fb_entries = []
+    fb_entries.sort(key=lambda e: e.name)
+    for e in fb_entries:
+        meta = read_frontmatter(Path(e.path))
+        if meta.get("read") is not True:
+            feedbacks.append({"feedback_file": e.path, "meta": meta})
+    payload = {
+        "pending_artifacts": pending,
+        "unread_feedback":   feedbacks,
+    }
+    resource_read(
+        f"blueprint://pending  ({len(pending)} pending, {len(feedbacks)} unread feedback)"
+    )
+    return _dumps(payload)
+
+
+# URI → handler; adding a resource means a handler here plus an entry in list_resources
+_RESOURCE_HANDLERS: dict[str, Callable[[], str]] = {
+    "blueprint://index":           _read_index,
+    "blueprint://pending":         _read_pending,
+    "blueprint://knowledge/brain": _brain_text,
+}
+
 
 def register_resources(server: Server) -> None:
     """Register all blueprint:// resource URIs with the MCP server."""
+    _brain_text()
 
     @server.list_resources()
     async def list_resources() -> list[Resource]:
@@ -45,57 +151,9 @@ def register_resources(server: Server) -> None:
 
     @server.read_resource()
     async def read_resource(uri: str) -> str:  # SDK expects a plain str return
-        resource_read(str(uri))
-
-        if str(uri) == "blueprint://index":
-            idx  = build_index()
-            data = to_json(idx)
-            resource_read(f"blueprint://index  ({len(data)} artifacts)")
-            return json.dumps(data, ensure_ascii=False, indent=2)
-
-        if str(uri) == "blueprint://pending":
-            idx = build_index()
-            pending = [
-                v for v in idx.values()
-                if v["meta"].get("status") in ("REVIEW", "NEEDS_FIX")
-            ]
-            feedback_dir = BLUEPRINT_ROOT / "inbound" / "User_Feedback"
-            feedbacks: list[dict] = []
-            if feedback_dir.exists():
-                for fb_file in sorted(feedback_dir.glob("FB-*.md")):
-                    meta = read_frontmatter(fb_file)
-                    if meta.get("read") is not True:
-                        feedbacks.append({"feedback_file": str(fb_file), "meta": meta})
-            payload = {
-                "pending_artifacts": to_json(build_index_from(pending)),
-                "unread_feedback":   feedbacks,
-            }
-            resource_read(
-                f"blueprint://pending  ({len(pending)} pending, {len(feedbacks)} unread feedback)"
-            )
-            return json.dumps(payload, ensure_ascii=False, indent=2)
-
-        if str(uri) == "blueprint://knowledge/brain":
-            brain_dir = BLUEPRINT_ROOT / "dev_docs" / "brain"
-            sections: list[str] = []
-            for fname in ("Design_Patterns.md", "Anti_Patterns.md", "Terminology.md"):
-                fpath = brain_dir / fname
-                if fpath.exists():
-                    sections.append(f"## {fname}\n\n{fpath.read_text(encoding='utf-8')}")
-            return "\n\n---\n\n".join(sections) or "Knowledge base is empty."
-
-        return f"Unknown resource URI: {uri}"
-
-
-def build_index_from(entries: list[dict]) -> list[dict]:
-    """Serialize a list of artifact entry dicts to JSON-safe list."""
-    result = []
-    for e in entries:
-        result.append({
-            "id":           e["meta"].get("id", ""),
-            "type":         e.get("type", ""),
-            "path":         str(e["path"]),
-            "meta":         e["meta"],
-            "body_snippet": e.get("body_snippet", ""),
-        })
-    return result
+        uri = str(uri)
+        resource_read(uri)
+        handler = _RESOURCE_HANDLERS.get(uri)
+        if not handler:
+            return f"Unknown resource URI: {uri}"
+        return handler()
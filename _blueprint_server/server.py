@@ -24,6 +24,9 @@ from logger import server_start
 
 
 def create_server() -> Server:
+    """Build a Server with all handlers attached.
+    Handlers are bound per instance, but the data behind them (tool schemas, prompt
+    listing, protocol text) is built once per process, so repeated calls stay cheap."""
     server = Server(SERVER_NAME)
     register_resources(server)
     register_prompts(server)
@@ -6,22 +6,24 @@ forbidden status transitions, gate violations, and duplicate IDs.
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator
 
 from artifact_index import build_index
+from config import BLUEPRINT_ROOT
 
 
 # YAML fields that are treated as parent references
 PARENT_FIELDS = ("parent_goal", "parent_feat", "parent_uc", "origin")
 
 # Required YAML fields per artifact type
-REQUIRED_FIELDS: dict[str, list[str]] = {
-    "Goal":     ["id", "title", "status"],
-    "Feature":  ["id", "title", "status", "parent_goal"],
-    "Research": ["id", "hypothesis", "verdict", "parent_goal"],
-    "UseCase":  ["id", "title", "status", "parent_feat", "dependencies"],
-    "Task":     ["id", "title", "status", "parent_uc"],
+REQUIRED_FIELDS: dict[str, tuple[str, ...]] = {
+    "Goal":     ("id", "title", "status"),
+    "Feature":  ("id", "title", "status", "parent_goal"),
+    "Research": ("id", "hypothesis", "verdict", "parent_goal"),
+    "UseCase":  ("id", "title", "status", "parent_feat", "dependencies"),
+    "Task":     ("id", "title", "status", "parent_uc"),
 }
 
 # Valid status values (must match VALID_STATUSES in agent_tools.py)
@@ -37,7 +39,7 @@ FORBIDDEN_TRANSITIONS: dict[str, frozenset[str]] = {
 }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationError:
     artifact_id: str
     artifact_type: str
@@ -51,25 +53,45 @@ class ValidationError:
 @dataclass
 class ValidationReport:
     errors: list[ValidationError] = field(default_factory=list)
+    # (len(errors) when split, errors, warnings); errors is append-only, so its length marks staleness
+    _split: tuple[int, list[ValidationError], list[ValidationError]] = field(
+        default=(-1, [], []), init=False, repr=False, compare=False,
+    )
+
+    @classmethod
+    def from_iter(cls, errors: Iterable[ValidationError]) -> ValidationReport:
+        return cls(errors=list(errors))
+
+    def _by_severity(self) -> tuple[list[ValidationError], list[ValidationError]]:
+        """(errors, warnings) from one pass over self.errors, reused until it grows."""
+        if self._split[0] != len(self.errors):
+            errors: list[ValidationError] = []
+            warnings: list[ValidationError] = []
+            for e in self.errors:
+                if e.severity == "ERROR":
+                    errors.append(e)
+                elif e.severity == "WARNING":
+                    warnings.append(e)
+            self._split = (len(self.errors), errors, warnings)
+        return self._split[1], self._split[2]
 
     @property
     def has_errors(self) -> bool:
-        return any(e.severity == "ERROR" for e in self.errors)
+        return bool(self._by_severity()[0])
 
     @property
     def error_count(self) -> int:
-        return sum(1 for e in self.errors if e.severity == "ERROR")
+        return len(self._by_severity()[0])
 
     @property
     def warning_count(self) -> int:
-        return sum(1 for e in self.errors if e.severity == "WARNING")
+        return len(self._by_severity()[1])
 
     def summary(self) -> str:
         if not self.errors:
             return "✅ All artifacts are valid. No traceability issues found."
         lines = []
-        errors   = [e for e in self.errors if e.severity == "ERROR"]
-        warnings = [e for e in self.errors if e.severity == "WARNING"]
+        errors, warnings = self._by_severity()
         if errors:
             lines.append(f"❌ Found {len(errors)} error(s):")
             for err in errors:
@@ -81,194 +103,289 @@ class ValidationReport:
         return "\n".join(lines)
 
 
+def _gate_task_parent(
+    artifact_id: str, atype: str, meta: dict, path: str, idx: dict[str, Any],
+    research_goals: set[str],
+) -> Iterator[ValidationError]:
+    """G1: a Task's parent UseCase must be APPROVED."""
+    parent_uc_id = str(meta.get("parent_uc", ""))
+    parent = idx.get(parent_uc_id)
+    if not parent:
+        return
+    parent_status = parent["meta"].get("status")
+    if parent_status != "APPROVED":
+        yield ValidationError(
+            artifact_id=artifact_id,
+            artifact_type=atype,
+            path=path,
+            error_type="BLOCKED_BY_PARENT",
+            detail=(
+                f"Task created while parent UseCase '{parent_uc_id}' "
+                f"has status '{parent_status}' (must be APPROVED)."
+            ),
+        )
+
+
+def _gate_usecase_research(
+    artifact_id: str, atype: str, meta: dict, path: str, idx: dict[str, Any],
+    research_goals: set[str],
+) -> Iterator[ValidationError]:
+    """G2: a UseCase under a research_required Feature needs a SUCCESS/PENDING Research Spike."""
+    parent_feat_id = str(meta.get("parent_feat", ""))
+    feat = idx.get(parent_feat_id)
+    if not (feat and feat["meta"].get("research_required") in _TRUTHY):
+        return
+    # Check if any Research artifact links to this feature's parent goal
+    # with verdict SUCCESS or PENDING
+    feat_goal = str(feat["meta"].get("parent_goal", ""))
+    if feat_goal not in research_goals:
+        yield ValidationError(
+            artifact_id=artifact_id,
+            artifact_type=atype,
+            path=path,
+            error_type="GATE_VIOLATION",
+            detail=(
+                f"Parent Feature '{parent_feat_id}' has research_required: true "
+                f"but no Research Spike with verdict SUCCESS or PENDING was found "
+                f"for goal '{feat_goal}'. Run P2 Research protocol first."
+            ),
+        )
+
+
+# Values of research_required that count as true; a tuple, since YAML may hand us unhashable values
+_TRUTHY = (True, "true", "True")
+
+
+def _research_goals(idx: dict[str, Any]) -> set[str]:
+    """parent_goal of every Research artifact whose verdict is SUCCESS or PENDING."""
+    return {
+        str(e["meta"].get("parent_goal", ""))
+        for e in idx.values()
+        if e["type"] == "Research" and e["meta"].get("verdict") in ("SUCCESS", "PENDING")
+    }
+
+
+# Gates that only apply to one artifact type; other types skip them entirely
+_GATES_BY_TYPE: dict[str, tuple[Callable[..., Iterator[ValidationError]], ...]] = {
+    "Task":    (_gate_task_parent,),
+    "UseCase": (_gate_usecase_research,),
+}
+
+
+def _norm_deps(deps: Any) -> list[str]:
+    """The dependencies field as a list; None means none, a string is a '[A, B]' list written inline."""
+    if deps is None:
+        return []
+    if isinstance(deps, str):
+        return [d.strip() for d in deps.strip("[]").split(",") if d.strip()]
+    return deps
+
+
+def _find_cycles(graph: dict[str, list[str]]) -> list[list[str]]:
+    """Return one dependency cycle per strongly connected component, as [a, b, ..., a].
+
+    Iterative Tarjan over integer node ids, so deep dependency chains cannot hit the
+    recursion limit. Dependencies on ids outside `graph` are ignored. Cycles are
+    ordered, and rotated to start, at the member that comes first in `graph`.
+    """
+    ids = list(graph)
+    pos = {aid: i for i, aid in enumerate(ids)}
+    adj = [[pos[d] for d in graph[aid] if d in pos] for aid in ids]
+    n = len(ids)
+
+    order = [-1] * n      # discovery index, -1 = unvisited
+    low = [0] * n
+    on_stack = bytearray(n)
+    scc_stack: list[int] = []
+    components: list[list[int]] = []
+    counter = 0
+
+    for root in range(n):
+        if order[root] != -1:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        scc_stack.append(root)
+        on_stack[root] = 1
+        work = [(root, iter(adj[root]))]
+        while work:
+            v, neighbors = work[-1]
+            for w in neighbors:
+                if order[w] == -1:
+                    order[w] = low[w] = counter
+                    counter += 1
+                    scc_stack.append(w)
+                    on_stack[w] = 1
+                    work.append((w, iter(adj[w])))
+                    break
+                if on_stack[w] and order[w] < low[v]:
+                    low[v] = order[w]
+            else:
+                work.pop()
+                if work:
+                    u = work[-1][0]
+                    if low[v] < low[u]:
+                        low[u] = low[v]
+                if low[v] == order[v]:
+                    component = []
+                    while True:
+                        w = scc_stack.pop()
+                        on_stack[w] = 0
+                        component.append(w)
+                        if w == v:
+                            break
+                    if len(component) > 1 or v in adj[v]:
+                        components.append(component)
+
+    cycles: list[list[int]] = []
+    for component in components:
+        members = set(component)
+        # Walk inside the component until a node repeats; the repeated stretch is a cycle
+        seen: dict[int, int] = {}
+        path: list[int] = []
+        v = min(component)
+        while v not in seen:
+            seen[v] = len(path)
+            path.append(v)
+            v = next(w for w in adj[v] if w in members)
+        cycle = path[seen[v]:]
+        start = cycle.index(min(cycle))
+        cycle = cycle[start:] + cycle[:start]
+        cycles.append(cycle + [cycle[0]])
+    cycles.sort(key=lambda c: c[0])
+    return [[ids[i] for i in cycle] for cycle in cycles]
+
+
+def _feedback_names() -> set[str]:
+    """Names of the entries in inbound/User_Feedback, from a single directory read."""
+    try:
+        with os.scandir(BLUEPRINT_ROOT / "inbound" / "User_Feedback") as it:
+            return {e.name for e in it}
+    except FileNotFoundError:
+        return set()
+
+
 def validate_traceability(index: dict[str, Any] | None = None) -> ValidationReport:
     """Run all traceability checks on the current artifact index."""
+    return ValidationReport.from_iter(iter_validate(index))
+
+
+def iter_validate(index: dict[str, Any] | None = None) -> Iterator[ValidationError]:
+    """Yield traceability findings one at a time, in the order validate_traceability reports them."""
     idx = index if index is not None else build_index()
-    report = ValidationReport()
 
     # ── G4: Duplicate ID check ────────────────────────────────────────────────
-    # The index build uses last-wins; independently scan files for collisions
-    seen_ids: dict[str, list[str]] = {}
-    for artifact_id, entry in idx.items():
-        seen_ids.setdefault(artifact_id, []).append(str(entry["path"]))
-    # Note: index deduplicates by default; to catch real-disk duplicates we
-    # check if two different paths share the same id in frontmatter by rescanning
-    # (the index already handles it, but we add a warning for awareness)
-    # For now flag if any entry path basename doesn't start with the id prefix
+    # The index build uses last-wins, so true on-disk collisions are not visible
+    # here; flag any entry whose file name doesn't match its id instead
+    paths = {artifact_id: str(entry["path"]) for artifact_id, entry in idx.items()}
     for artifact_id, entry in idx.items():
         fname = entry["path"].stem
         if fname != artifact_id:
-            report.errors.append(ValidationError(
+            yield ValidationError(
                 artifact_id=artifact_id,
                 artifact_type=entry["type"],
-                path=str(entry["path"]),
+                path=paths[artifact_id],
                 error_type="DUPLICATE_ID",
                 detail=(
                     f"File name '{fname}.md' does not match declared id '{artifact_id}'. "
                     "Rename file or fix the id field."
                 ),
-            ))
+            )
 
+    # Hoisted lookups for the per-artifact loop. Each check first collects its
+    # failures with a comprehension; ValidationError objects are only built for hits.
+    required_for = REQUIRED_FIELDS.get
+    research_goals = _research_goals(idx)
+    graph: dict[str, list[str]] = {}  # artifact id -> normalized dependencies, for G9
     for artifact_id, entry in idx.items():
         atype = entry["type"]
         meta  = entry["meta"]
-        path  = str(entry["path"])
+        meta_get = meta.get
+        path  = paths[artifact_id]
 
         # ── G5: Check required fields ─────────────────────────────────────────
-        for required_field in REQUIRED_FIELDS.get(atype, []):
-            if not meta.get(required_field):
-                report.errors.append(ValidationError(
-                    artifact_id=artifact_id,
-                    artifact_type=atype,
-                    path=path,
-                    error_type="MISSING_FIELD",
-                    detail=f"Required field '{required_field}' is missing or empty.",
-                ))
+        missing = [f for f in required_for(atype, ()) if not meta_get(f)]
+        if missing:
+            yield from (ValidationError(
+                artifact_id=artifact_id,
+                artifact_type=atype,
+                path=path,
+                error_type="MISSING_FIELD",
+                detail=f"Required field '{required_field}' is missing or empty.",
+            ) for required_field in missing)
 
         # ── G3: Check that parent references resolve ───────────────────────────
-        for pfield in PARENT_FIELDS:
-            parent_id = meta.get(pfield)
-            if parent_id and str(parent_id) not in idx:
-                report.errors.append(ValidationError(
-                    artifact_id=artifact_id,
-                    artifact_type=atype,
-                    path=path,
-                    error_type="ORPHAN",
-                    detail=f"Parent reference '{pfield}: {parent_id}' does not exist in the index.",
-                ))
+        orphans = [
+            (pfield, parent_id) for pfield in PARENT_FIELDS
+            if (parent_id := meta_get(pfield)) and str(parent_id) not in idx
+        ]
+        if orphans:
+            yield from (ValidationError(
+                artifact_id=artifact_id,
+                artifact_type=atype,
+                path=path,
+                error_type="ORPHAN",
+                detail=f"Parent reference '{pfield}: {parent_id}' does not exist in the index.",
+            ) for pfield, parent_id in orphans)
 
         # ── G8: Dependency Check (Horizontal Traceability) ────────────────────
-        deps = meta.get("dependencies")
-        if deps is None:
-            # Not an error, just assume empty for validation
-            deps = []
-        
-        if isinstance(deps, str):
-             # Handle string representation of list if parsed lazily
-             deps = [d.strip() for d in deps.strip("[]").split(",") if d.strip()]
-        
+        deps = graph[artifact_id] = _norm_deps(meta_get("dependencies"))
+        is_done = meta_get("status") == "DONE"
         for dep_id in deps:
             if dep_id not in idx:
-                report.errors.append(ValidationError(
+                yield ValidationError(
                     artifact_id=artifact_id,
                     artifact_type=atype,
                     path=path,
                     error_type="ORPHAN",
                     detail=f"Dependency '{dep_id}' does not exist in the index.",
-                ))
-            elif meta.get("status") == "DONE":
+                )
+            elif is_done:
                 dep_entry = idx[dep_id]
                 if dep_entry["meta"].get("status") != "DONE":
-                    report.errors.append(ValidationError(
+                    yield ValidationError(
                         artifact_id=artifact_id,
                         artifact_type=atype,
                         path=path,
                         error_type="GATE_VIOLATION",
                         detail=f"Cannot mark '{artifact_id}' as DONE while dependency '{dep_id}' is '{dep_entry['meta'].get('status')}'.",
-                    ))
-
-        # ── G1: Task Gate ─────────────────────────────────────────────────────
-        if atype == "Task":
-            parent_uc_id = str(meta.get("parent_uc", ""))
-            parent = idx.get(parent_uc_id)
-            if parent and parent["meta"].get("status") not in ("APPROVED",):
-                report.errors.append(ValidationError(
-                    artifact_id=artifact_id,
-                    artifact_type=atype,
-                    path=path,
-                    error_type="BLOCKED_BY_PARENT",
-                    detail=(
-                        f"Task created while parent UseCase '{parent_uc_id}' "
-                        f"has status '{parent['meta'].get('status')}' (must be APPROVED)."
-                    ),
-                ))
-
-        # ── G2: Analysis Gate — Feature with research_required must have SUCCESS RS ──
-        if atype == "UseCase":
-            parent_feat_id = str(meta.get("parent_feat", ""))
-            feat = idx.get(parent_feat_id)
-            if feat and feat["meta"].get("research_required") in (True, "true", "True"):
-                # Check if any Research artifact links to this feature's parent goal
-                # with verdict SUCCESS or PENDING
-                feat_goal = str(feat["meta"].get("parent_goal", ""))
-                linked_rs = [
-                    e for e in idx.values()
-                    if e["type"] == "Research"
-                    and str(e["meta"].get("parent_goal", "")) == feat_goal
-                    and e["meta"].get("verdict") in ("SUCCESS", "PENDING")
-                ]
-                if not linked_rs:
-                    report.errors.append(ValidationError(
-                        artifact_id=artifact_id,
-                        artifact_type=atype,
-                        path=path,
-                        error_type="GATE_VIOLATION",
-                        detail=(
-                            f"Parent Feature '{parent_feat_id}' has research_required: true "
-                            f"but no Research Spike with verdict SUCCESS or PENDING was found "
-                            f"for goal '{feat_goal}'. Run P2 Research protocol first."
-                        ),
-                ))
+                    )
+
+        # ── Type-specific gates (G1 Task, G2 UseCase) ─────────────────────────
+        for gate in _GATES_BY_TYPE.get(atype, ()):
+            yield from gate(artifact_id, atype, meta, path, idx, research_goals)
 
     # ── G9: Circular Dependency Check ─────────────────────────────────────────
-    graph: dict[str, list[str]] = {}
-    for aid, entry in idx.items():
-        meta = entry["meta"]
-        deps = meta.get("dependencies", [])
-        if isinstance(deps, str):
-            deps = [d.strip() for d in deps.strip("[]").split(",") if d.strip()]
-        graph[aid] = deps
-
-    def find_cycle(node_id: str, visited: set[str], stack: set[str]) -> list[str] | None:
-        visited.add(node_id)
-        stack.add(node_id)
-        for neighbor in graph.get(node_id, []):
-            if neighbor not in visited:
-                cycle = find_cycle(neighbor, visited, stack)
-                if cycle:
-                    cycle.append(node_id)
-                    return cycle
-            elif neighbor in stack:
-                return [neighbor, node_id]
-        stack.remove(node_id)
-        return None
-
-    visited_nodes: set[str] = set()
-    for art_id in graph:
-        if art_id not in visited_nodes:
-            cycle_found = find_cycle(art_id, visited_nodes, set())
-            if cycle_found:
-                # cycle_found is [start, ..., end, start] in reverse order
-                cycle_str = " -> ".join(reversed(cycle_found))
-                entry = idx[art_id]
-                report.errors.append(ValidationError(
-                    artifact_id=art_id,
-                    artifact_type=entry["type"],
-                    path=str(entry["path"]),
-                    error_type="GATE_VIOLATION",
-                    detail=f"Circular dependency detected: {cycle_str}",
-                ))
-                break # Report first cycle found
+    # graph was filled by the G8 pass above
+    for cycle in _find_cycles(graph):
+        entry = idx[cycle[0]]
+        yield ValidationError(
+            artifact_id=cycle[0],
+            artifact_type=entry["type"],
+            path=paths[cycle[0]],
+            error_type="GATE_VIOLATION",
+            detail=f"Circular dependency detected: {' -> '.join(cycle)}",
+        )
 
     # ── W3: Soft Warning — NEEDS_FIX without feedback file ────────────────
-        status = str(meta.get("status", ""))
+    feedback_names: set[str] | None = None  # listed once, on the first artifact that needs it
+    for artifact_id, entry in idx.items():
+        status = str(entry["meta"].get("status", ""))
         if status in ("NEEDS_FIX", "REJECTED"):
-            from config import BLUEPRINT_ROOT
-            fb_path = BLUEPRINT_ROOT / "inbound" / "User_Feedback" / f"FB-{artifact_id}.md"
-            if not fb_path.exists():
-                report.errors.append(ValidationError(
+            if feedback_names is None:
+                feedback_names = _feedback_names()
+            if f"FB-{artifact_id}.md" not in feedback_names:
+                yield ValidationError(
                     artifact_id=artifact_id,
-                    artifact_type=atype,
-                    path=path,
+                    artifact_type=entry["type"],
+                    path=paths[artifact_id],
                     error_type="SOFT_WARNING",
                     detail=(
                         f"Artifact has status '{status}' but no feedback file "
                         f"'FB-{artifact_id}.md' exists. Agent cannot determine fix reason."
                     ),
                     severity="WARNING",
-                ))
-
-    return report
+                )
 
 
 def check_transition(artifact_id: str, current_status: str, new_status: str) -> str | None:
@@ -288,3 +405,27 @@ def check_transition(artifact_id: str, current_status: str, new_status: str) ->
             f"Use NEEDS_FIX first, then fix and resubmit to REVIEW."
         )
     return None
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Validate blueprint artifact traceability.")
+    parser.add_argument(
+        "--stream", action="store_true",
+        help="print each finding as soon as it is found instead of a grouped summary",
+    )
+    args = parser.parse_args()
+
+    if args.stream:
+        has_errors = False
+        for err in iter_validate():
+            tag = "ERROR" if err.severity == "ERROR" else "WARN"
+            has_errors = has_errors or tag == "ERROR"
+            print(f"[{tag}/{err.error_type}] {err.artifact_id} ({err.artifact_type}): {err.detail}", flush=True)
+    else:
+        report = validate_traceability()
+        print(report.summary())
+        has_errors = report.has_errors
+    sys.exit(1 if has_errors else 0)
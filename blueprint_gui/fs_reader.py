@@ -7,25 +7,86 @@ from __future__ import annotations
 
 import re
 import sys
+import warnings
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:  # libyaml bindings; same output, parsed in C
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+    warnings.warn(
+        "PyYAML was built without libyaml; front-matter parsing falls back to the "
+        "pure-Python loader. Install libyaml (e.g. libyaml-dev) and reinstall PyYAML.",
+        RuntimeWarning,
+        stacklevel=2,
+    )
+
 FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
 BLUEPRINT_ROOT: Path = Path(__file__).parent.parent / "_blueprint"
 
 
+class _FrontmatterDumper(_SafeDumper):
+    # Block-style mappings, lists of scalars inline (`dependencies: [TSK-001]`) like the templates
+    pass
+
+
+def _represent_list(dumper: _FrontmatterDumper, data: list) -> yaml.Node:
+    flow = all(v is None or isinstance(v, (str, int, float, bool)) for v in data)
+    return dumper.represent_sequence("tag:yaml.org,2002:seq", data, flow_style=flow)
+
+
+_FrontmatterDumper.add_representer(list, _represent_list)
+
+
+def _match_frontmatter(text: str) -> tuple[str, int] | None:
+    # str.find for plain '---' delimiters; CRLF / trailing spaces go through the regex
+    if not text.startswith("---"):
+        return None
+    if text.startswith("---\n"):
+        end = text.find("\n---", 4)
+        if end != -1 and text.startswith("\n", end + 4):
+            return text[4:end], end + 5
+    m = FRONTMATTER_RE.match(text)
+    return (m.group(1), m.end()) if m else None
+
+
+# Front-matter normally ends well inside this many bytes; the body is only read if it doesn't
+_HEAD_BYTES = 4096
+
+
+def _decode_head(data: bytes) -> str | None:
+    # A multi-byte character cut at the end of the head is dropped; anything else is invalid
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError as e:
+        if e.start >= len(data) - 3:
+            return data[:e.start].decode("utf-8", errors="ignore")
+        return None
+
+
 def read_frontmatter(path: Path) -> dict[str, Any]:
     try:
-        text = path.read_text(encoding="utf-8")
+        with path.open("rb") as f:
+            data = f.read(_HEAD_BYTES)
+            if not data.startswith(b"---"):
+                return {}
+            m = None
+            if len(data) == _HEAD_BYTES:
+                head = _decode_head(data)
+                m = _match_frontmatter(head) if head is not None else None
+                if m is None:
+                    data += f.read()
+            if m is None:
+                m = _match_frontmatter(data.decode("utf-8"))
     except (OSError, UnicodeDecodeError):
         return {}
-    m = FRONTMATTER_RE.match(text)
     if not m:
         return {}
     try:
-        return yaml.safe_load(m.group(1)) or {}
+        return yaml.load(m[0], Loader=_SafeLoader) or {}
     except yaml.YAMLError:
         return {}
 
@@ -35,13 +96,39 @@ def read_body(path: Path) -> str:
         text = path.read_text(encoding="utf-8")
     except (OSError, UnicodeDecodeError):
         return ""
-    return FRONTMATTER_RE.sub("", text, count=1).strip()
+    m = _match_frontmatter(text)
+    return (text[m[1]:] if m else text).strip()
+
+
+def read_artifact(path: Path) -> tuple[dict[str, Any], str]:
+    """(front-matter, stripped body) from a single read of the file."""
+    try:
+        text = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return {}, ""
+    m = _match_frontmatter(text)
+    if not m:
+        return {}, text.strip()
+    try:
+        meta = yaml.load(m[0], Loader=_SafeLoader) or {}
+    except yaml.YAMLError:
+        meta = {}
+    return meta, text[m[1]:].strip()
 
 
 def patch_frontmatter(path: Path, updates: dict[str, Any]) -> None:
-    import yaml as _yaml
-    meta = read_frontmatter(path)
-    body = read_body(path)
+    try:
+        text = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        text = ""
+    m = _match_frontmatter(text)
+    meta: dict[str, Any] = {}
+    if m:
+        try:
+            meta = yaml.load(m[0], Loader=_SafeLoader) or {}
+        except yaml.YAMLError:
+            pass
+    body = (text[m[1]:] if m else text).strip()
     meta.update(updates)
-    yaml_block = _yaml.dump(meta, allow_unicode=True, sort_keys=False)
+    yaml_block = yaml.dump(meta, Dumper=_FrontmatterDumper, allow_unicode=True, sort_keys=False)
     path.write_text(f"---\n{yaml_block}---\n\n{body}", encoding="utf-8")
@@ -12,27 +12,36 @@ Provides 6 panels:
 from __future__ import annotations
 
 import datetime
+import hashlib
 import json
+import os
+import queue
 import subprocess
 import sys
 import tempfile
+import threading
+import time
+from collections import Counter
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 import markdown as md_lib
 import yaml
 
-from PySide6.QtCore import Qt, QFileSystemWatcher, QTimer
-from PySide6.QtGui import QColor, QFont, QPixmap
+from PySide6.QtCore import (
+    Qt, QAbstractItemModel, QFileSystemWatcher, QModelIndex, QObject, QRunnable,
+    QSortFilterProxyModel, QThreadPool, QTimer, QUrl, Signal,
+)
+from PySide6.QtGui import QColor, QDesktopServices, QFont, QPixmap
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QTabWidget, QWidget, QVBoxLayout,
     QHBoxLayout, QTableWidget, QTableWidgetItem, QHeaderView,
-    QTreeWidget, QTreeWidgetItem, QTextBrowser, QLabel, QPlainTextEdit,
+    QTreeView, QTextBrowser, QLabel, QPlainTextEdit,
     QPushButton, QSplitter, QListWidget, QListWidgetItem, QScrollArea,
     QMessageBox, QComboBox, QLineEdit, QGroupBox, QFileDialog, QFrame,
 )
 
-from fs_reader import BLUEPRINT_ROOT, read_frontmatter, read_body, patch_frontmatter
+from fs_reader import BLUEPRINT_ROOT, read_frontmatter, read_artifact, patch_frontmatter
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -121,22 +130,310 @@ INBOUND_PROTOCOL_HINT: dict[str, str] = {
 # Helper
 # ---------------------------------------------------------------------------
 
+# folder -> {file name: (mtime_ns, size, front-matter)}; rebuilt on every scan of the
+# folder, so deleted files drop out and only new or changed files are parsed
+_SCAN_CACHE: dict[str, dict[str, tuple[int, int, dict[str, Any]]]] = {}
+
+
+def _scan_folder(folder: Path) -> list[tuple[Path, dict[str, Any]]]:
+    key = str(folder)
+    old = _SCAN_CACHE.get(key, {})
+    new: dict[str, tuple[int, int, dict[str, Any]]] = {}
+    try:
+        with os.scandir(folder) as it:
+            files = [e for e in it if e.name.endswith(".md") and e.is_file()]
+    except OSError:
+        _SCAN_CACHE.pop(key, None)
+        return []
+    results = []
+    for e in sorted(files, key=lambda e: e.name):
+        try:
+            st = e.stat()
+        except OSError:
+            continue
+        cached = old.get(e.name)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            meta = cached[2]
+        else:
+            meta = read_frontmatter(Path(e.path))
+        new[e.name] = (st.st_mtime_ns, st.st_size, meta)
+        results.append((Path(e.path), meta))
+    _SCAN_CACHE[key] = new
+    return results
+
+
 def _scan_artifacts(entity_name: str) -> list[dict[str, Any]]:
     cfg = ENTITY_CONFIG[entity_name]
     prefix = cfg["prefix"]
-    folder: Path = cfg["dir"]
-    results = []
-    if folder.exists():
-        for f in sorted(folder.glob("*.md")):
-            meta = read_frontmatter(f)
-            if str(meta.get("id", "")).startswith(prefix):
-                results.append({"path": f, "meta": meta})
-    return results
+    return [
+        {"path": f, "meta": meta}
+        for f, meta in _scan_folder(cfg["dir"])
+        if str(meta.get("id", "")).startswith(prefix)
+    ]
+
+
+def _entities_for_path(path: str) -> set[str] | None:
+    """Entity types a watcher event on `path` can affect: those whose folder is the
+    path, holds it, or is a direct child of it. None if a folder further up changed,
+    in which case every type has to be rescanned."""
+    p = Path(path)
+    owners: set[str] = set()
+    for entity_name, cfg in ENTITY_CONFIG.items():
+        folder = cfg["dir"]
+        if folder == p or folder == p.parent or folder.parent == p:
+            owners.add(entity_name)
+        elif p in folder.parents:
+            return None
+    return owners
+
+
+# One Markdown converter per extension set; building one loads and registers every
+# extension, which is most of the cost of rendering a short body
+_MARKDOWN: dict[tuple[str, ...], md_lib.Markdown] = {}
+
+
+def _markdown_html(text: str, extensions: tuple[str, ...] = ("fenced_code", "tables")) -> str:
+    md = _MARKDOWN.get(extensions)
+    if md is None:
+        md = _MARKDOWN[extensions] = md_lib.Markdown(extensions=list(extensions))
+    return md.reset().convert(text)
+
+
+def _artifact_html(meta: dict, body: str) -> str:
+    """Viewer page for an artifact: a front-matter strip above the rendered body."""
+    meta_html = "  ".join(
+        f"<span style='color:#a6adc8'>{k}:</span> <b>{v}</b>"
+        for k, v in meta.items()
+    )
+    return (
+        f"<div style='background:#181825;padding:6px 10px;border-radius:4px;"
+        f"font-size:11px;margin-bottom:6px'>{meta_html}</div>"
+        f"{_markdown_html(body)}"
+    )
+
+
+# Front-matter keys that point at an artifact's parent, nearest first
+_PARENT_KEYS = ("parent_uc", "parent_feat", "parent_goal", "origin")
+
+
+def _parent_id(meta: dict) -> str | None:
+    for key in _PARENT_KEYS:
+        val = meta.get(key)
+        if val:
+            return str(val)
+    return None
+
+
+# Built once; callers share these and must not modify them
+_STATUS_QCOLOR: dict[str, QColor] = {k: QColor(v) for k, v in STATUS_COLORS.items()}
+_STATUS_QCOLOR_DEFAULT = QColor("#2a2a2a")
 
 
 def _color_for_status(status: str) -> QColor:
-    hex_color = STATUS_COLORS.get(status, "#2a2a2a")
-    return QColor(hex_color)
+    return _STATUS_QCOLOR.get(status, _STATUS_QCOLOR_DEFAULT)
+
+
+# ---------------------------------------------------------------------------
+# Artifact tree model: type → status group → artifact, read by the view on demand
+# ---------------------------------------------------------------------------
+
+class _TreeNode:
+    """One row of the artifact tree. Only leaves carry an `entry` ({"path", "meta"}).
+    A status group may hold its entries in `deferred` until the view first opens it."""
+
+    __slots__ = ("label", "status", "attention", "entry", "parent", "row", "children", "deferred")
+
+    def __init__(
+        self, label: str, status: str = "", attention: bool = False,
+        entry: dict | None = None,
+    ) -> None:
+        self.label = label
+        self.status = status
+        self.attention = attention
+        self.entry = entry
+        self.parent: _TreeNode | None = None
+        self.row = 0
+        self.children: list[_TreeNode] = []
+        self.deferred: list[dict] | None = None
+
+    def add(self, child: _TreeNode) -> _TreeNode:
+        child.parent = self
+        child.row = len(self.children)
+        self.children.append(child)
+        return child
+
+    def add_artifacts(self, entries: list[dict]) -> None:
+        """Append one leaf per entry, in id order."""
+        for entry in sorted(entries, key=lambda e: str(e["meta"].get("id", ""))):
+            meta  = entry["meta"]
+            aid   = str(meta.get("id", "?"))
+            title = str(meta.get("title", meta.get("hypothesis", "")))
+            label = f"{aid}  —  {title[:38]}" if title else aid
+            # Attention items are drawn bold
+            self.add(_TreeNode(label, self.status, self.attention, entry))
+
+
+class ArtifactTreeModel(QAbstractItemModel):
+    """Single-column tree over plain _TreeNode lists. No per-row Qt objects are
+    created; labels, colours and fonts are handed out by data() as rows are painted."""
+
+    def __init__(self, parent: QWidget | None = None):
+        super().__init__(parent)
+        self._roots: list[_TreeNode] = []
+        self._type_colors = (QColor("#a6adc8"), QColor("#f90"))  # plain / has attention items
+        self._type_font = QFont("Segoe UI", 9, QFont.Bold)
+        self._status_font = QFont("Segoe UI", 8, QFont.Bold)
+        self._attention_font = QFont("Segoe UI", 9)
+        self._attention_font.setBold(True)
+
+    def set_roots(self, roots: list[_TreeNode]) -> None:
+        self.beginResetModel()
+        self._roots = roots
+        self.endResetModel()
+
+    def roots(self) -> list[_TreeNode]:
+        return self._roots
+
+    def node(self, index: QModelIndex) -> _TreeNode | None:
+        return index.internalPointer() if index.isValid() else None
+
+    def index_of(self, node: _TreeNode) -> QModelIndex:
+        return self.createIndex(node.row, 0, node)
+
+    # ── QAbstractItemModel interface ─────────────────────────────────────────
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        siblings = parent.internalPointer().children if parent.isValid() else self._roots
+        if column != 0 or not 0 <= row < len(siblings):
+            return QModelIndex()
+        return self.createIndex(row, 0, siblings[row])
+
+    def parent(self, index: QModelIndex) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+        up = index.internalPointer().parent
+        return QModelIndex() if up is None else self.createIndex(up.row, 0, up)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if not parent.isValid():
+            return len(self._roots)
+        return len(parent.internalPointer().children) if parent.column() == 0 else 0
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 1
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if not parent.isValid():
+            return bool(self._roots)
+        node: _TreeNode = parent.internalPointer()
+        return bool(node.children or node.deferred)
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        return parent.isValid() and bool(parent.internalPointer().deferred)
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        """Build a deferred group's leaves; the view calls this when the group is opened."""
+        if not parent.isValid():
+            return
+        node: _TreeNode = parent.internalPointer()
+        entries, node.deferred = node.deferred, None
+        if not entries:
+            return
+        self.beginInsertRows(parent, 0, len(entries) - 1)
+        node.add_artifacts(entries)
+        self.endInsertRows()
+
+    def fetch_all(self) -> None:
+        """Build every deferred group, e.g. before a search has to look inside them."""
+        for type_node in self._roots:
+            for status_node in type_node.children:
+                if status_node.deferred:
+                    self.fetchMore(self.index_of(status_node))
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.internalPointer().entry is None:
+            return Qt.ItemIsEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return "Artifacts"
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node: _TreeNode = index.internalPointer()
+        if role == Qt.DisplayRole:
+            return node.label
+        if role == Qt.ForegroundRole:
+            if node.parent is None:  # entity type header
+                return self._type_colors[node.attention]
+            return _color_for_status(node.status)
+        if role == Qt.FontRole:
+            if node.parent is None:
+                return self._type_font
+            if node.entry is None:
+                return self._status_font
+            return self._attention_font if node.attention else None
+        if role == Qt.UserRole:
+            return node.entry
+        return None
+
+
+class ArtifactFilterProxy(QSortFilterProxyModel):
+    """Search / pending-only filter for ArtifactTreeModel. Recursive filtering keeps
+    a group row visible while any row below it passes."""
+
+    def __init__(self, attention_statuses: set[str], parent: QWidget | None = None):
+        super().__init__(parent)
+        self.setRecursiveFilteringEnabled(True)
+        self._attention = attention_statuses
+        self._search = ""
+        self._pending_only = False
+
+    def set_search(self, text: str) -> None:
+        self._search = text.lower().strip()
+        self.invalidateFilter()
+
+    def set_pending_only(self, pending_only: bool) -> None:
+        self._pending_only = pending_only
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        node: _TreeNode = self.sourceModel().index(source_row, 0, source_parent).internalPointer()
+        if self._pending_only:
+            # Status groups and leaves in an attention status; type rows follow them
+            return node.parent is not None and node.status in self._attention
+        if node.entry is None:
+            return not self._search
+        return not self._search or self._search in node.label.lower()
+
+
+class _ScanSignals(QObject):
+    finished = Signal(object)  # {entity name: [entry, ...]}
+
+
+class ScanWorker(QRunnable):
+    """Runs _scan_artifacts for the given entity types on a pool thread. The result is
+    delivered to the GUI thread through `signals.finished` (a queued connection)."""
+
+    def __init__(self, entities: Iterable[str]) -> None:
+        super().__init__()
+        self.signals = _ScanSignals()
+        wanted = set(entities)
+        self._entities = [e for e in ENTITY_CONFIG if e in wanted]
+
+    def run(self) -> None:
+        scans: dict[str, list[dict[str, Any]]] = {}
+        try:
+            for entity_name in self._entities:
+                scans[entity_name] = _scan_artifacts(entity_name)
+        finally:
+            # Always report back, so the panel never waits on a scan that died
+            self.signals.finished.emit(scans)
 
 
 # ---------------------------------------------------------------------------
@@ -185,10 +482,14 @@ class ArtifactWorkbenchPanel(QWidget):
         filter_row.addWidget(self._pending_btn)
         left_layout.addLayout(filter_row)
 
-        self._tree = QTreeWidget()
-        self._tree.setHeaderLabel("Artifacts")
+        self._model = ArtifactTreeModel(self)
+        self._proxy = ArtifactFilterProxy(self._ATTENTION_STATUSES, self)
+        self._proxy.setSourceModel(self._model)
+        self._tree = QTreeView()
+        self._tree.setModel(self._proxy)
+        self._tree.setUniformRowHeights(True)
         self._tree.setIndentation(14)
-        self._tree.itemClicked.connect(self._on_tree_click)
+        self._tree.clicked.connect(self._on_tree_click)
         self._tree.setContextMenuPolicy(Qt.CustomContextMenu)
         self._tree.customContextMenuRequested.connect(self._show_context_menu)
         left_layout.addWidget(self._tree)
@@ -283,9 +584,16 @@ class ArtifactWorkbenchPanel(QWidget):
         root_layout.addWidget(main_splitter)
 
         self._index: dict[str, dict] = {}
+        self._parent_of: dict[str, str | None] = {}
+        self._collapsed: set[_TreeNode] = set()  # ARCHIVED / DONE groups, closed (and unbuilt) by default
         self._current_path: Path | None = None
         self._current_meta: dict = {}
         self._pending_only: bool = False
+        # path -> ((mtime_ns, size), meta, body, viewer html) of artifacts opened in the viewer
+        self._body_cache: dict[Path, tuple[tuple[int, int], dict, str, str]] = {}
+        self._scan_signals: _ScanSignals | None = None  # set while a scan is in flight
+        self._scans: dict[str, list[dict[str, Any]]] = {}  # last scan result per entity type
+        self._dirty: set[str] = set()  # entity types waiting for the next scan
 
     # ── Helpers ──────────────────────────────────────────────────────────────
 
@@ -309,81 +617,89 @@ class ArtifactWorkbenchPanel(QWidget):
         "APPROVED", "DONE",                   # completed
         "ARCHIVED",                           # cold storage
     ]
+    _STATUS_RANK: dict[str, int] = {s: i for i, s in enumerate(_STATUS_ORDER)}
 
     # ── Refresh / build tree ─────────────────────────────────────────────────
 
-    def refresh(self) -> None:
+    def refresh(self, entities: Iterable[str] | None = None) -> None:
+        """Rescan the folders of `entities` (every type if None) off the GUI thread;
+        the tree is rebuilt in _on_scan_finished with the other types taken from the
+        last scan. A refresh during a scan queues one more scan after it."""
+        self._dirty.update(ENTITY_CONFIG if entities is None else entities)
+        if self._dirty and self._scan_signals is None:
+            self._start_scan()
+
+    def _start_scan(self) -> None:
+        worker = ScanWorker(self._dirty)
+        self._dirty = set()
+        worker.signals.finished.connect(self._on_scan_finished)
+        self._scan_signals = worker.signals  # kept alive until the result arrives
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_scan_finished(self, scans: dict[str, list[dict[str, Any]]]) -> None:
+        self._scan_signals = None
+        self._scans = {e: scans[e] if e in scans else self._scans.get(e, []) for e in ENTITY_CONFIG}
+        if self._dirty:
+            self._start_scan()
+        self._populate(self._scans)
+
+    def _populate(self, scans: dict[str, list[dict[str, Any]]]) -> None:
         self._index = {}
-        self._tree.clear()
+        self._collapsed = set()
+        # A search has to see every leaf, so nothing is deferred while one is active
+        defer = not self._search_bar.text().strip()
+        roots: list[_TreeNode] = []
         total = 0
-        status_counts: dict[str, int] = {}
+        status_counts: Counter[str] = Counter()
 
-        for entity_name in ENTITY_CONFIG:
-            all_entries = _scan_artifacts(entity_name)
+        for entity_name, all_entries in scans.items():
             if not all_entries:
                 continue
 
-            # Count attention items for header badge
-            attention_count = sum(
-                1 for e in all_entries
-                if str(e["meta"].get("status", "")) in self._ATTENTION_STATUSES
-            )
-            badge = f"  ⚠️ {attention_count}" if attention_count else ""
-            type_item = QTreeWidgetItem([f"{entity_name}{badge}"])
-            type_item.setFont(0, QFont("Segoe UI", 9, QFont.Bold))
-            type_item.setForeground(0, QColor("#f90" if attention_count else "#a6adc8"))
-            type_item.setFlags(type_item.flags() & ~Qt.ItemIsSelectable)
-
-            # Group entries by status
+            # Group entries by status; the counts below are read off the groups
             by_status: dict[str, list] = {}
             for entry in all_entries:
-                status = str(entry["meta"].get("status", "DRAFT"))
-                by_status.setdefault(status, []).append(entry)
-                status_counts[status] = status_counts.get(status, 0) + 1
-                total += 1
+                by_status.setdefault(str(entry["meta"].get("status", "DRAFT")), []).append(entry)
                 self._index[str(entry["meta"].get("id", ""))] = entry
+            status_counts.update({status: len(entries) for status, entries in by_status.items()})
+            total += len(all_entries)
+
+            # Count attention items for header badge
+            attention_count = sum(len(by_status.get(s, ())) for s in self._ATTENTION_STATUSES)
+            badge = f"  ⚠️ {attention_count}" if attention_count else ""
+            type_node = _TreeNode(f"{entity_name}{badge}", attention=bool(attention_count))
 
             # Add status sub-groups in defined order
-            ordered = sorted(
-                by_status.items(),
-                key=lambda kv: self._STATUS_ORDER.index(kv[0])
-                    if kv[0] in self._STATUS_ORDER else 99
-            )
+            ordered = sorted(by_status.items(), key=lambda kv: self._STATUS_RANK.get(kv[0], 99))
             for status, entries in ordered:
                 emoji = self._STATUS_EMOJI.get(status, "")
-                status_item = QTreeWidgetItem([f"  {emoji} {status}  ({len(entries)})"])
-                status_item.setForeground(0, _color_for_status(status))
-                status_item.setFont(0, QFont("Segoe UI", 8, QFont.Bold))
-                status_item.setFlags(status_item.flags() & ~Qt.ItemIsSelectable)
-
-                for entry in sorted(entries, key=lambda e: str(e["meta"].get("id", ""))):
-                    meta  = entry["meta"]
-                    aid   = str(meta.get("id", "?"))
-                    title = str(meta.get("title", meta.get("hypothesis", "")))
-                    label = f"{aid}  —  {title[:38]}" if title else aid
-                    child = QTreeWidgetItem([label])
-                    child.setForeground(0, _color_for_status(status))
-                    child.setData(0, Qt.UserRole, entry)
-                    # Bold attention items
-                    if status in self._ATTENTION_STATUSES:
-                        f = QFont("Segoe UI", 9)
-                        f.setBold(True)
-                        child.setFont(0, f)
-                    status_item.addChild(child)
-
-                type_item.addChild(status_item)
-
-            self._tree.addTopLevelItem(type_item)
+                attention = status in self._ATTENTION_STATUSES
+                status_node = type_node.add(
+                    _TreeNode(f"  {emoji} {status}  ({len(entries)})", status, attention)
+                )
+                if status in ("ARCHIVED", "DONE"):
+                    self._collapsed.add(status_node)
+                    if defer:
+                        status_node.deferred = entries
+                        continue
+                status_node.add_artifacts(entries)
 
-        self._tree.expandAll()
-        # Collapse ARCHIVED and DONE by default to reduce noise
-        for i in range(self._tree.topLevelItemCount()):
-            root = self._tree.topLevelItem(i)
-            for j in range(root.childCount()):
-                child = root.child(j)
-                txt = child.text(0)
-                if "ARCHIVED" in txt or "DONE" in txt:
-                    child.setExpanded(False)
+            roots.append(type_node)
+
+        # Trace paths in _load() follow this instead of re-probing parent keys per hop
+        self._parent_of = {aid: _parent_id(entry["meta"]) for aid, entry in self._index.items()}
+
+        # Drop viewer cache entries for artifacts that are gone
+        paths = {entry["path"] for entry in self._index.values()}
+        self._body_cache = {p: v for p, v in self._body_cache.items() if p in paths}
+
+        # One repaint for the reset and the expansion pass together
+        self._tree.setUpdatesEnabled(False)
+        try:
+            self._model.set_roots(roots)
+            self._apply_expansion()
+        finally:
+            self._tree.setUpdatesEnabled(True)
 
         # Update status bar
         if total == 0:
@@ -392,14 +708,30 @@ class ArtifactWorkbenchPanel(QWidget):
             parts = [f"{cnt} {s}" for s, cnt in sorted(status_counts.items())]
             self._status_bar_lbl.setText(f"{total} artifacts  ·  " + "  ·  ".join(parts))
 
-        # Re-apply pending filter if active
+    def _apply_expansion(self) -> None:
+        """Open every type row and status group except ARCHIVED and DONE, which stay
+        closed to reduce noise. In pending-only mode every visible (attention) group is open."""
         if self._pending_only:
-            self._apply_pending_filter()
+            self._tree.expandAll()
+            return
+        # Group by group rather than expandAll(), which would build the deferred groups
+        proxy = self._proxy
+        for i in range(proxy.rowCount()):
+            type_index = proxy.index(i, 0)
+            self._tree.expand(type_index)
+            for j in range(proxy.rowCount(type_index)):
+                status_index = proxy.index(j, 0, type_index)
+                if self._model.node(proxy.mapToSource(status_index)) not in self._collapsed:
+                    self._tree.expand(status_index)
 
     # ── Tree interaction ─────────────────────────────────────────────────────
 
-    def _on_tree_click(self, item: QTreeWidgetItem, _col: int) -> None:
-        entry = item.data(0, Qt.UserRole)
+    def _entry_at(self, index: QModelIndex) -> dict | None:
+        node = self._model.node(self._proxy.mapToSource(index))
+        return node.entry if node else None
+
+    def _on_tree_click(self, index: QModelIndex) -> None:
+        entry = self._entry_at(index)
         if entry:
             self._load(entry["path"], entry["meta"])
 
@@ -408,53 +740,26 @@ class ArtifactWorkbenchPanel(QWidget):
         if checked:
             self._apply_pending_filter()
         else:
+            self._proxy.set_pending_only(False)
             self._filter_tree(self._search_bar.text())
 
     def _apply_pending_filter(self) -> None:
-        """Show only NEEDS_FIX and REJECTED artifact leaves."""
-        for i in range(self._tree.topLevelItemCount()):
-            type_node = self._tree.topLevelItem(i)
-            type_visible = False
-            for j in range(type_node.childCount()):
-                status_node = type_node.child(j)
-                txt = status_node.text(0)
-                is_attention = any(s in txt for s in ("NEEDS_FIX", "REJECTED", "BLOCKED"))
-                status_node.setHidden(not is_attention)
-                if is_attention:
-                    status_node.setExpanded(True)
-                    type_visible = True
-            type_node.setHidden(not type_visible)
-            if type_visible:
-                type_node.setExpanded(True)
+        """Show only NEEDS_FIX, REJECTED and BLOCKED artifact groups."""
+        self._proxy.set_pending_only(True)
+        self._tree.expandAll()
 
     def _filter_tree(self, text: str) -> None:
         if self._pending_only:
             return
-        search = text.lower().strip()
-        for i in range(self._tree.topLevelItemCount()):
-            type_node = self._tree.topLevelItem(i)
-            type_visible = False
-            for j in range(type_node.childCount()):
-                status_node = type_node.child(j)
-                status_visible = False
-                status_node.setHidden(False)
-                for k in range(status_node.childCount()):
-                    leaf = status_node.child(k)
-                    match = not search or search in leaf.text(0).lower()
-                    leaf.setHidden(not match)
-                    if match:
-                        status_visible = True
-                status_node.setHidden(not status_visible and bool(search))
-                if status_visible or not search:
-                    type_visible = True
-            type_node.setHidden(not type_visible and bool(search))
+        if text.strip():
+            self._model.fetch_all()
+        self._proxy.set_search(text)
+        # Rows the filter brings back come in collapsed
+        self._apply_expansion()
 
     def _show_context_menu(self, pos) -> None:
         """Right-click context menu with quick actions."""
-        item = self._tree.itemAt(pos)
-        if not item:
-            return
-        entry = item.data(0, Qt.UserRole)
+        entry = self._entry_at(self._tree.indexAt(pos))
         if not entry:
             return
         meta = entry["meta"]
@@ -463,7 +768,6 @@ class ArtifactWorkbenchPanel(QWidget):
             return
 
         from PySide6.QtWidgets import QMenu
-        import subprocess, platform
         menu = QMenu(self)
         menu.setStyleSheet(
             "QMenu { background:#181825; color:#cdd6f4; border:1px solid #313244; }"
@@ -495,54 +799,53 @@ class ArtifactWorkbenchPanel(QWidget):
         a_copy.triggered.connect(copy_id)
 
         a_open = menu.addAction("📂  Open File")
-        def open_file():
-            path = str(entry["path"])
-            if platform.system() == "Windows":
-                subprocess.Popen(["explorer", path])
-            else:
-                subprocess.Popen(["xdg-open", path])
-        a_open.triggered.connect(open_file)
+        a_open.triggered.connect(
+            lambda: QDesktopServices.openUrl(QUrl.fromLocalFile(str(entry["path"])))
+        )
 
         menu.exec_(self._tree.viewport().mapToGlobal(pos))
 
     # ── Load artifact ─────────────────────────────────────────────────────────
 
+    def _read_artifact(self, path: Path) -> tuple[dict, str, str]:
+        """read_artifact() and its viewer page, reused while the file's mtime and size
+        are unchanged."""
+        try:
+            st = path.stat()
+        except OSError:
+            return {}, "", ""
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._body_cache.get(path)
+        if cached and cached[0] == stamp:
+            return cached[1], cached[2], cached[3]
+        meta, body = read_artifact(path)
+        html = _artifact_html(meta, body)
+        self._body_cache[path] = (stamp, meta, body, html)
+        return meta, body, html
+
     def _load(self, path: Path, meta: dict) -> None:
+        # Front-matter and body come from the same read; the scanned meta is only a fallback
+        disk_meta, body, html = self._read_artifact(path)
+        if not disk_meta and meta:
+            html = _artifact_html(meta, body)
+        meta = disk_meta or meta
         self._current_path = path
         self._current_meta = meta
 
         # Viewer
-        body = read_body(path)
-        html = md_lib.markdown(body, extensions=["fenced_code", "tables"])
-        meta_html = "  ".join(
-            f"<span style='color:#a6adc8'>{k}:</span> <b>{v}</b>"
-            for k, v in meta.items()
-        )
-        self._content_browser.setHtml(
-            f"<div style='background:#181825;padding:6px 10px;border-radius:4px;"
-            f"font-size:11px;margin-bottom:6px'>{meta_html}</div>"
-            f"{html}"
-        )
+        self._content_browser.setHtml(html)
 
         # Trace path
         chain: list[str] = []
-        cur = meta
         visited: set[str] = set()
-        while True:
-            aid = str(cur.get("id", ""))
-            if aid in visited:
-                break
+        aid = str(meta.get("id", ""))
+        parent = _parent_id(meta)  # the loaded meta may be newer than the last scan
+        while aid not in visited:
             visited.add(aid)
             chain.append(aid)
-            parent = None
-            for key in ("parent_uc", "parent_feat", "parent_goal", "origin"):
-                val = cur.get(key)
-                if val:
-                    parent = str(val)
-                    break
             if not parent or parent not in self._index:
                 break
-            cur = self._index[parent]["meta"]
+            aid, parent = parent, self._parent_of.get(parent)
         self._trace_label.setText("Trace: " + " → ".join(reversed(chain)))
 
         # Critique
@@ -617,6 +920,89 @@ def _find_java() -> str:
     return "java"
 
 
+class _PlantUMLPipe:
+    """One long-lived `plantuml -pipe` JVM that renders diagrams one after another,
+    so only the first render pays for JVM start-up. Each PNG it writes to stdout is
+    followed by DELIMITER; a reader thread moves stdout into a queue so waits can time out."""
+
+    DELIMITER = b"--BLUEPRINT-PNG-END--"
+
+    def __init__(self, java: str) -> None:
+        self._java = java
+        self._proc: subprocess.Popen | None = None
+        self._chunks: queue.Queue[bytes] = queue.Queue()
+        self._buf = b""
+
+    def _ensure_started(self) -> subprocess.Popen | None:
+        if self._proc is not None and self._proc.poll() is None:
+            return self._proc
+        self.close()
+        try:
+            proc = subprocess.Popen(
+                [self._java, "-jar", str(_PUML_JAR), "-tpng", "-pipe",
+                 "-pipedelimitor", self.DELIMITER.decode()],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            )
+        except OSError:
+            return None
+        self._chunks = queue.Queue()
+        self._buf = b""
+        threading.Thread(target=self._pump, args=(proc.stdout, self._chunks), daemon=True).start()
+        self._proc = proc
+        return proc
+
+    @staticmethod
+    def _pump(stream, chunks: queue.Queue[bytes]) -> None:
+        # read1 hands over whatever has arrived, so a finished PNG is never held back
+        while data := stream.read1(65536):
+            chunks.put(data)
+        chunks.put(b"")  # EOF: the JVM exited
+
+    def render(self, src: bytes, timeout: float) -> bytes | None:
+        """PNG bytes for one diagram, or None if the JVM could not be used (the caller
+        falls back to a one-off run). Raises subprocess.TimeoutExpired after `timeout`."""
+        proc = self._ensure_started()
+        if proc is None:
+            return None
+        try:
+            proc.stdin.write(src.rstrip() + b"\n")
+            proc.stdin.flush()
+        except OSError:
+            self.close()
+            return None
+        deadline = time.monotonic() + timeout
+        while (end := self._buf.find(self.DELIMITER)) == -1:
+            try:
+                data = self._chunks.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                self.close()
+                raise subprocess.TimeoutExpired(proc.args, timeout) from None
+            if not data:
+                self.close()
+                return None
+            self._buf += data
+        # The delimiter line's newline is left at the front of the next response
+        png = self._buf[:end].lstrip(b"\r\n")
+        rest = self._buf[end + len(self.DELIMITER):]
+        if rest.strip():
+            # A reply nobody asked for (a source with several diagrams) would be handed
+            # to the next render; start over with a fresh JVM instead
+            self.close()
+        self._buf = b""
+        return png or None
+
+    def close(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        proc.kill()
+        proc.wait()
+
+
 class PlantUMLPanel(QWidget):
     """Panel 2: PlantUML diagram viewer (bundled JAR) + diagram critique."""
 
@@ -715,6 +1101,14 @@ class PlantUMLPanel(QWidget):
         self._current_source: Path | None = None
         self._tmp_dir = tempfile.mkdtemp()
         self._java    = _find_java()
+        # Rendered PNGs named by a hash of the diagram source: an unchanged diagram is
+        # never re-rendered, and an edited one gets a new name, so nothing goes stale
+        self._png_cache_dir = Path(self._tmp_dir) / "cache"
+        self._png_cache_dir.mkdir(exist_ok=True)
+        self._pipe = _PlantUMLPipe(self._java)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._pipe.close)
 
     # ── Refresh ───────────────────────────────────────────────────────────────
 
@@ -743,55 +1137,87 @@ class PlantUMLPanel(QWidget):
         self._status_label.setText(f"Rendering {orig.name}…")
         QApplication.processEvents()
 
-        source = self._extract_puml_from_md(orig) if orig.suffix == ".md" else orig
-        if source is None:
-            self._status_label.setText("No @startuml block found.")
+        try:
+            text = orig.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError) as e:
+            self._status_label.setText(f"❌ Cannot read {orig.name}: {e}")
             return
+        # The shared JVM answers once per diagram, so it only ever gets a single block
+        source = self._extract_puml_from_md(text)
+        use_pipe = source is not None
+        if source is None:
+            if orig.suffix == ".md":
+                self._status_label.setText("No @startuml block found.")
+                return
+            source = text  # let a one-off run report on it
 
+        src_bytes = source.encode("utf-8")
+        out_png = self._png_cache_dir / f"{hashlib.blake2b(src_bytes, digest_size=12).hexdigest()}.png"
+        if not out_png.exists():
+            png = self._render_png(src_bytes, use_pipe)
+            if png is None:
+                return
+            tmp_png = out_png.with_suffix(".tmp")
+            tmp_png.write_bytes(png)
+            tmp_png.replace(out_png)
+
+        pix = QPixmap(str(out_png))
+        if pix.isNull():
+            out_png.unlink(missing_ok=True)
+            self._status_label.setText("❌ Render failed — no PNG produced.")
+            return
+        self._img_label.setPixmap(pix)
+        self._img_label.resize(pix.size())
+        self._current_png = out_png
+        tag = "✅ Approved" if "Approved" in str(orig) else "📝 Draft"
+        self._status_label.setText(f"{tag}  ·  {orig.stem}")
+        self._diag_label.setText(f"  {orig.stem}  │  {tag}")
+        self._load_history(orig)
+
+    def _render_png(self, src_bytes: bytes, use_pipe: bool = True) -> bytes | None:
+        """Render one diagram source to PNG bytes, through the shared pipe JVM when
+        `use_pipe` and possible. Reports the problem in the status label and returns
+        None on failure."""
         if not _PUML_JAR.exists():
             self._status_label.setText(f"❌ JAR not found: {_PUML_JAR}")
-            return
-
-        out_dir = Path(self._tmp_dir)
-        out_png = out_dir / f"{source.stem}.png"
-
+            return None
+        if use_pipe:
+            try:
+                png = self._pipe.render(src_bytes, timeout=30)
+            except subprocess.TimeoutExpired:
+                self._status_label.setText("❌ Render timed out.")
+                return None
+            if png is not None:
+                return png
+
+        # The long-lived JVM is unavailable or unsuitable; render with a one-off process
         try:
             res = subprocess.run(
-                [self._java, "-jar", str(_PUML_JAR), "-tpng", "-o", str(out_dir), str(source)],
-                capture_output=True, timeout=30, text=True,
+                [self._java, "-jar", str(_PUML_JAR), "-tpng", "-pipe"],
+                input=src_bytes, capture_output=True, timeout=30,
             )
-            if res.returncode != 0:
-                err = (res.stderr or res.stdout or "unknown")[:200]
-                self._status_label.setText(f"❌ PlantUML: {err}")
-                return
         except FileNotFoundError:
             self._status_label.setText(f"❌ Java not found at: {self._java}")
-            return
+            return None
         except subprocess.TimeoutExpired:
             self._status_label.setText("❌ Render timed out.")
-            return
-
-        if out_png.exists():
-            pix = QPixmap(str(out_png))
-            self._img_label.setPixmap(pix)
-            self._img_label.resize(pix.size())
-            self._current_png = out_png
-            tag = "✅ Approved" if "Approved" in str(orig) else "📝 Draft"
-            self._status_label.setText(f"{tag}  ·  {orig.stem}")
-            self._diag_label.setText(f"  {orig.stem}  │  {tag}")
-            self._load_history(orig)
-        else:
+            return None
+        if res.returncode != 0:
+            err = (res.stderr or res.stdout or b"unknown").decode("utf-8", errors="replace")[:200]
+            self._status_label.setText(f"❌ PlantUML: {err}")
+            return None
+        if not res.stdout:
             self._status_label.setText("❌ Render failed — no PNG produced.")
+            return None
+        return res.stdout
 
-    def _extract_puml_from_md(self, md: Path) -> Path | None:
-        text  = md.read_text(encoding="utf-8")
+    @staticmethod
+    def _extract_puml_from_md(text: str) -> str | None:
         start = text.find("@startuml")
-        end   = text.find("@enduml")
+        end   = text.find("@enduml", start)
         if start == -1 or end == -1:
             return None
-        tmp = Path(self._tmp_dir) / f"{md.stem}.puml"
-        tmp.write_text(text[start: end + len("@enduml")], encoding="utf-8")
-        return tmp
+        return text[start: end + len("@enduml")]
 
     # ── Critique ──────────────────────────────────────────────────────────────
 
@@ -824,7 +1250,9 @@ class PlantUMLPanel(QWidget):
         if not self._current_png or not self._current_png.exists():
             QMessageBox.warning(self, "No image", "Render a diagram first.")
             return
-        dest, _ = QFileDialog.getSaveFileName(self, "Save PNG", self._current_png.name, "PNG (*.png)")
+        # Cached PNGs are named by content hash; offer the diagram's own name
+        name = f"{self._current_source.stem}.png" if self._current_source else self._current_png.name
+        dest, _ = QFileDialog.getSaveFileName(self, "Save PNG", name, "PNG (*.png)")
         if dest:
             import shutil
             shutil.copy(self._current_png, dest)
@@ -1422,10 +1850,7 @@ class PromptsPanel(QWidget):
         proto_path = BLUEPRINT_ROOT / rel_path
         self._viewer_title.setText(f"  {label}")
         if proto_path.exists():
-            html = md_lib.markdown(
-                proto_path.read_text(encoding="utf-8"),
-                extensions=["fenced_code", "tables"],
-            )
+            html = _markdown_html(proto_path.read_text(encoding="utf-8"))
             self._viewer_browser.setHtml(
                 "<style>"
                 "body{background:#11111b;color:#cdd6f4;font-family:sans-serif;font-size:13px;}"
@@ -1578,18 +2003,19 @@ class RoadmapPanel(QWidget):
             rows.append((entity_name, total, approved, pending, pct))
 
         self._table.setRowCount(len(rows))
+        approved_fg = QColor("#a6e3a1")
         for row_idx, (name, total, approved, pending, pct) in enumerate(rows):
             for col_idx, val in enumerate([name, str(total), str(approved), str(pending), pct]):
                 item = QTableWidgetItem(val)
                 item.setFlags(item.flags() & ~Qt.ItemIsEditable)
                 if col_idx == 2:
-                    item.setForeground(QColor("#a6e3a1"))
+                    item.setForeground(approved_fg)
                 self._table.setItem(row_idx, col_idx, item)
         self._table.resizeColumnsToContents()
 
         roadmap_path = BLUEPRINT_ROOT / "execution" / "roadmap.md"
         if roadmap_path.exists():
-            html = md_lib.markdown(roadmap_path.read_text(encoding="utf-8"), extensions=["tables"])
+            html = _markdown_html(roadmap_path.read_text(encoding="utf-8"), ("tables",))
             self._roadmap_text.setHtml(html)
         else:
             self._roadmap_text.setPlainText("roadmap.md not found in _blueprint/execution/")
@@ -1599,6 +2025,12 @@ class RoadmapPanel(QWidget):
 # Main Window
 # ---------------------------------------------------------------------------
 
+# File-system events are coalesced into one refresh once they go quiet for
+# REFRESH_DEBOUNCE_MS; a steady stream still refreshes every REFRESH_MAX_DELAY_MS
+REFRESH_DEBOUNCE_MS = 300
+REFRESH_MAX_DELAY_MS = 2000
+
+
 class MainWindow(QMainWindow):
     def __init__(self) -> None:
         super().__init__()
@@ -1652,17 +2084,17 @@ class MainWindow(QMainWindow):
             }
 
             /* Tree */
-            QTreeWidget {
+            QTreeView {
                 border: 1px solid #313244;
                 background: #11111b;
                 show-decoration-selected: 1;
                 outline: none;
             }
-            QTreeWidget::item:selected {
+            QTreeView::item:selected {
                 background: #313244;
                 color: #cba6f7;
             }
-            QTreeWidget::item:hover { background: #24273a; }
+            QTreeView::item:hover { background: #24273a; }
 
             /* Lists */
             QListWidget {
@@ -1817,8 +2249,16 @@ class MainWindow(QMainWindow):
 
         # No cross-panel wiring needed — workbench is self-contained
 
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(REFRESH_DEBOUNCE_MS)
+        self._refresh_timer.timeout.connect(self._refresh_all)
+        self._refresh_deadline = 0.0
+        # Entity types touched since the last refresh; None means rescan them all
+        self._dirty_entities: set[str] | None = None
+
         # File system watcher — auto-refresh on any change in _blueprint/
-        self._watcher = QFileSystemWatcher()
+        self._watcher = QFileSystemWatcher(self)
         self._watcher.addPath(str(BLUEPRINT_ROOT))
         for d in BLUEPRINT_ROOT.rglob("*"):
             if d.is_dir():
@@ -1826,17 +2266,25 @@ class MainWindow(QMainWindow):
         self._watcher.directoryChanged.connect(self._scheduled_refresh)
         self._watcher.fileChanged.connect(self._scheduled_refresh)
 
-        self._refresh_timer = QTimer()
-        self._refresh_timer.setSingleShot(True)
-        self._refresh_timer.timeout.connect(self._refresh_all)
         self._refresh_all()
 
-    def _scheduled_refresh(self) -> None:
-        """Debounce rapid file-system events into a single refresh."""
-        self._refresh_timer.start(300)
+    def _scheduled_refresh(self, path: str) -> None:
+        """Debounce rapid file-system events into a single refresh.
+        Each event restarts the timer, but never past REFRESH_MAX_DELAY_MS after
+        the first event of a burst, so a long batch of writes still shows progress.
+        The event's entity types are collected so the workbench rescans only those."""
+        if self._dirty_entities is not None:
+            owners = _entities_for_path(path)
+            self._dirty_entities = None if owners is None else self._dirty_entities | owners
+        now = time.monotonic()
+        if not self._refresh_timer.isActive():
+            self._refresh_deadline = now + REFRESH_MAX_DELAY_MS / 1000
+        remaining_ms = int((self._refresh_deadline - now) * 1000)
+        self._refresh_timer.start(max(0, min(REFRESH_DEBOUNCE_MS, remaining_ms)))
 
     def _refresh_all(self) -> None:
-        self._workbench.refresh()
+        dirty, self._dirty_entities = self._dirty_entities, set()
+        self._workbench.refresh(dirty)
         self._roadmap.refresh()
         self._inbound_editor.refresh()
         self._plantuml.refresh()